@@ -1,16 +1,75 @@
+import argparse
 from pathlib import Path
 
 from src.application.service import BookService
 from src.domain.repository import BaseBookRepository
-from src.infra.adapter import CliAdapter
-from src.infra.repository import JsonBookRepository
+from src.infra.adapter import BookImporter, CliAdapter
+from src.infra.repository import BinaryBookRepository, JsonBookRepository, SqliteBookRepository
+from src.infra.repository.migration import migrate_json_to_binary, migrate_json_to_sqlite, should_migrate_json
+
+BACKEND_JSON: str = 'json'
+BACKEND_SQLITE: str = 'sqlite'
+BACKEND_BINARY: str = 'binary'
+
+
+def parse_args() -> argparse.Namespace:
+    """
+    Разобрать аргументы командной строки.
+
+    Returns:
+        argparse.Namespace: выбранные параметры запуска
+    """
+    parser = argparse.ArgumentParser(description='Консольное приложение библиотеки книг')
+    parser.add_argument(
+        '--backend',
+        choices=(BACKEND_JSON, BACKEND_SQLITE, BACKEND_BINARY),
+        default=BACKEND_JSON,
+        help='хранилище книг: JSON файл, база SQLite или бинарный каталог (по умолчанию json)',
+    )
+    parser.add_argument(
+        '--import',
+        dest='import_path',
+        metavar='PATH',
+        help='импортировать книги из CSV или JSONL файла и завершить работу',
+    )
+    return parser.parse_args()
+
+
+def build_repository(backend: str, data_dir: Path) -> BaseBookRepository:
+    """
+    Создать хранилище книг выбранного типа.
+
+    При первом запуске с SQLite или бинарным каталогом книги однократно переносятся из существующего books.json.
+
+    Args:
+        backend: str тип хранилища
+        data_dir: Path каталог с файлами хранилища
+
+    Returns:
+        BaseBookRepository: хранилище книг
+    """
+    json_path: str = str(data_dir / 'books.json')
+    if backend == BACKEND_SQLITE:
+        sqlite_path: str = str(data_dir / 'books.sqlite3')
+        if should_migrate_json(json_path, sqlite_path):
+            migrate_json_to_sqlite(json_path, sqlite_path)
+        return SqliteBookRepository(file_path=sqlite_path)
+    if backend == BACKEND_BINARY:
+        binary_path: str = str(data_dir / 'books.bin')
+        if should_migrate_json(json_path, binary_path):
+            migrate_json_to_binary(json_path, binary_path)
+        return BinaryBookRepository(file_path=binary_path)
+    return JsonBookRepository(file_path=json_path)
 
 
 def main():
+    args: argparse.Namespace = parse_args()
     project_root: Path = Path(__file__).parent
-    file_path: str = str(project_root / '.data' / 'books.json')
-    repository: BaseBookRepository = JsonBookRepository(file_path=file_path)
+    repository: BaseBookRepository = build_repository(args.backend, project_root / '.data')
     book_service: BookService = BookService(repository)
+    if args.import_path:
+        BookImporter(book_service).main(args.import_path)
+        return
     adapter: CliAdapter = CliAdapter(book_service)
     adapter.main()
 
@@ -1 +1,2 @@
 from src.application.service.book_service import BookService  # noqa: F401
+from src.application.service.async_book_service import AsyncBookService  # noqa: F401
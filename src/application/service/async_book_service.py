@@ -0,0 +1,172 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, AsyncIterator, Callable, Iterable, List, Optional, Tuple
+
+from src.application.service.book_service import BookService
+from src.domain.entity import Book
+
+
+class AsyncBookService:
+    """
+    Асинхронный фасад над BookService для asyncio приложений.
+
+    Каждая операция выполняется в пуле потоков, поэтому чтение и запись файлов хранилища не блокируют
+    цикл событий. Хранилище сервиса должно быть потокобезопасным, например обернутым
+    в ThreadSafeBookRepository.
+    """
+
+    DEFAULT_MAX_WORKERS: int = 8
+
+    def __init__(self, book_service: BookService, max_workers: int = DEFAULT_MAX_WORKERS):
+        """
+        Создать асинхронный сервис и пул потоков.
+
+        Args:
+            book_service: BookService синхронный сервис библиотеки книг
+            max_workers: int количество потоков для операций с хранилищем
+        """
+        self.service: BookService = book_service
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max_workers, thread_name_prefix='book-service',
+        )
+
+    async def add_book(self, title: str, author: str, year: int) -> Book:
+        """
+        Добавить книгу в библиотеку.
+
+        Args:
+            title: Заголовок
+            author: Автор
+            year: Год издания
+
+        Returns:
+            Book: экземпляр сущности книга
+        """
+        return await self._run(self.service.add_book, title, author, year)
+
+    async def add_books(self, entries: Iterable[Tuple[str, str, int]]) -> List[Book]:
+        """
+        Добавить пакет книг в библиотеку.
+
+        Args:
+            entries: Iterable[Tuple[str, str, int]] заголовок, автор и год издания каждой книги
+
+        Returns:
+            list[Book]: добавленные книги в порядке входных данных
+        """
+        return await self._run(self.service.add_books, list(entries))
+
+    async def delete_book_by_id(self, book_id: int) -> None:
+        """
+        Удалить книгу по ID.
+
+        Args:
+            book_id: ID книги
+
+        Raises:
+            BookByIdNotFoundError: если не найдено книги с указанным ID
+        """
+        await self._run(self.service.delete_book_by_id, book_id)
+
+    async def search_books(
+        self,
+        title: Optional[str] = None,
+        author: Optional[str] = None,
+        year: Optional[int] = None,
+    ) -> List[Book]:
+        """
+        Найти книгу по заголовку, автору или году издания.
+
+        Args:
+            title: Заголовок
+            author: автор
+            year: год издания
+
+        Returns:
+            list[Book]: Список книг подходящих под поисковый критерий или пустой список если нет совпадений.
+        """
+        return await self._run(self.service.search_books, title=title, author=author, year=year)
+
+    async def list_books(self) -> List[Book]:
+        """
+        Отобразить все книги существующие в библиотеке.
+
+        Returns:
+            list[Book]: Список всех книг
+        """
+        return await self._run(self.service.list_books)
+
+    async def iter_books(self, page_size: int = 100, after_id: int = 0) -> AsyncIterator[Book]:
+        """
+        Лениво перебрать все книги библиотеки по возрастанию ID, загружая страницы в пуле потоков.
+
+        Args:
+            page_size: int количество книг, загружаемых из хранилища за один запрос
+            after_id: int начать с книги, следующей за указанным ID
+
+        Yields:
+            Book: очередная книга
+        """
+        while True:
+            page: list[Book] = await self.get_books_page(page_size, after_id=after_id)
+            for book in page:
+                yield book
+            if len(page) < page_size:
+                return
+            after_id = page[-1].id
+
+    async def get_books_page(self, page_size: int, after_id: int = 0, offset: int = 0) -> List[Book]:
+        """
+        Получить одну страницу книг, упорядоченных по ID.
+
+        Args:
+            page_size: int количество книг на странице
+            after_id: int курсор: последний ID предыдущей страницы
+            offset: int смещение от курсора
+
+        Returns:
+            list[Book]: книги страницы
+        """
+        return await self._run(self.service.get_books_page, page_size, after_id=after_id, offset=offset)
+
+    async def count_books(self) -> int:
+        """
+        Посчитать количество книг в библиотеке.
+
+        Returns:
+            int: количество книг
+        """
+        return await self._run(self.service.count_books)
+
+    async def set_book_status(self, book_id: int, new_status: str) -> None:
+        """
+        Изменить статус книги.
+
+        Args:
+            book_id: ID книги
+            new_status: новый статус для книги, доступные значения "available" или "borrowed"
+
+        Raises:
+            BookByIdNotFoundError: если не найдено книги с указанным ID
+        """
+        await self._run(self.service.set_book_status, book_id, new_status)
+
+    def close(self) -> None:
+        """Дождаться завершения операций и остановить пул потоков."""
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Выполнить синхронную операцию сервиса в пуле потоков.
+
+        Args:
+            function: Callable[..., Any] метод синхронного сервиса
+            *args: Any позиционные аргументы
+            **kwargs: Any именованные аргументы
+
+        Returns:
+            Any: результат операции
+        """
+        loop: asyncio.AbstractEventLoop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(function, *args, **kwargs))
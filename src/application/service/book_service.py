@@ -1,8 +1,8 @@
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional, Tuple
 
 from src.domain.entity import Book
 from src.domain.repository import BaseBookRepository
-from src.exception.exceptions import BookByIdNotFoundError
+from src.exception.exceptions import BookByIdNotFoundError, PublishingYearMustBeNumericError
 
 
 class BookService:
@@ -28,13 +28,41 @@ class BookService:
         Returns:
             Book: экземпляр сущности книга
         """
-        books: list[Book] = self.repository.list_books()
-        new_id: int = self._generate_unique_id(books)
-
+        new_id: int = self.repository.reserve_ids(1)[0]
         new_book: Book = Book(id=new_id, title=title, author=author, year=year)
         self.repository.add_book(new_book)
         return new_book
 
+    def add_books(self, entries: Iterable[Tuple[str, str, int]]) -> List[Book]:
+        """
+        Добавить пакет книг в библиотеку: одна проверка, одно резервирование ID и одно сохранение на пакет.
+
+        Пакет проверяется целиком до сохранения, поэтому при ошибке в библиотеку не попадает ни одна книга.
+
+        Args:
+            entries: Iterable[Tuple[str, str, int]] заголовок, автор и год издания каждой книги
+
+        Returns:
+            list[Book]: добавленные книги в порядке входных данных
+
+        Raises:
+            PublishingYearMustBeNumericError: если год издания одной из книг не является числом
+        """
+        drafts: list[Tuple[str, str, int]] = list(entries)
+        for _, _, year in drafts:
+            if not isinstance(year, int):
+                raise PublishingYearMustBeNumericError(given_year=str(year))
+        if not drafts:
+            return []
+
+        book_ids: range = self.repository.reserve_ids(len(drafts))
+        new_books: list[Book] = [
+            Book(id=book_id, title=title, author=author, year=year)
+            for book_id, (title, author, year) in zip(book_ids, drafts)
+        ]
+        self.repository.add_books(new_books)
+        return new_books
+
     def delete_book_by_id(self, book_id: int) -> None:
         """
         Удалить книгу по ID.
@@ -77,6 +105,42 @@ class BookService:
         """
         return self.repository.list_books()
 
+    def iter_books(self, page_size: int = 100, after_id: int = 0) -> Iterator[Book]:
+        """
+        Лениво перебрать все книги библиотеки по возрастанию ID, загружая их страницами.
+
+        Args:
+            page_size: int количество книг, загружаемых из хранилища за один запрос
+            after_id: int начать с книги, следующей за указанным ID
+
+        Returns:
+            Iterator[Book]: генератор книг
+        """
+        return self.repository.iter_books(page_size=page_size, after_id=after_id)
+
+    def get_books_page(self, page_size: int, after_id: int = 0, offset: int = 0) -> List[Book]:
+        """
+        Получить одну страницу книг, упорядоченных по ID.
+
+        Args:
+            page_size: int количество книг на странице
+            after_id: int курсор: последний ID предыдущей страницы
+            offset: int смещение от курсора, например для перехода к странице по номеру
+
+        Returns:
+            list[Book]: книги страницы
+        """
+        return self.repository.list_books_page(limit=page_size, after_id=after_id, offset=offset)
+
+    def count_books(self) -> int:
+        """
+        Посчитать количество книг в библиотеке.
+
+        Returns:
+            int: количество книг
+        """
+        return self.repository.count_books()
+
     def set_book_status(self, book_id: int, new_status: str) -> None:
         """
         Изменить статус книги.
@@ -94,16 +158,3 @@ class BookService:
 
         book.status = new_status
         self.repository.update_book(book)
-
-    @staticmethod
-    def _generate_unique_id(books: list[Book]) -> int:
-        """
-        Сгенерировать новый уникальный ID на основе уже существующих книг в репозитории.
-
-        Args:
-            books: list[Book] коллекция уже существующих книг
-
-        Returns:
-            int: новый свободный уникальный ID для книги
-        """
-        return max((book.id for book in books), default=0) + 1
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from src.exception.exceptions import IncorrectBookStatusError
 
 
-@dataclass
+@dataclass(slots=True)
 class Book:
     id: int
     title: str
@@ -1,10 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Iterable, Iterator, List, Optional
 
 from src.domain.entity import Book
 
 
 class BaseBookRepository(ABC):
+    """
+    Контракт хранилища книг.
+
+    Методы чтения возвращают копии книг: изменение полученного объекта не влияет на хранилище,
+    пока он не передан в update_book.
+    """
 
     @abstractmethod
     def add_book(self, book: Book) -> None:
@@ -15,6 +21,15 @@ class BaseBookRepository(ABC):
             book: Book экземпляр книги для добавления в репозиторий
         """
 
+    @abstractmethod
+    def add_books(self, books: Iterable[Book]) -> None:
+        """
+        Добавить пакет книг в репозиторий с одним сохранением на весь пакет.
+
+        Args:
+            books: Iterable[Book] книги для добавления
+        """
+
     @abstractmethod
     def delete_book_by_id(self, book_id: int) -> None:
         """
@@ -62,6 +77,48 @@ class BaseBookRepository(ABC):
         Returns: List[Book] список книг в репозитории
         """
 
+    @abstractmethod
+    def list_books_page(self, limit: int, after_id: int = 0, offset: int = 0) -> List[Book]:
+        """
+        Получить страницу книг, упорядоченных по ID.
+
+        Поддерживается пагинация по курсору (after_id, последний ID предыдущей страницы)
+        и по смещению (offset), их можно сочетать.
+
+        Args:
+            limit: int максимальное количество книг на странице
+            after_id: int вернуть только книги с ID больше указанного
+            offset: int пропустить указанное количество книг после курсора
+
+        Returns: List[Book] книги страницы, упорядоченные по ID
+        """
+
+    @abstractmethod
+    def count_books(self) -> int:
+        """
+        Посчитать количество книг в репозитории.
+
+        Returns: int количество книг
+        """
+
+    def iter_books(self, page_size: int = 100, after_id: int = 0) -> Iterator[Book]:
+        """
+        Лениво перебрать книги по ID, загружая их страницами.
+
+        Args:
+            page_size: int количество книг, загружаемых за один запрос к репозиторию
+            after_id: int начать с книги, следующей за указанным ID
+
+        Yields:
+            Book: очередная книга
+        """
+        while True:
+            page: List[Book] = self.list_books_page(limit=page_size, after_id=after_id)
+            yield from page
+            if len(page) < page_size:
+                return
+            after_id = page[-1].id
+
     @abstractmethod
     def update_book(self, book: Book) -> None:
         """
@@ -70,3 +127,17 @@ class BaseBookRepository(ABC):
         Args:
             book: Book экземпляр новой книги для замещения книги по ID в репозиторий
         """
+
+    @abstractmethod
+    def reserve_ids(self, count: int = 1) -> range:
+        """
+        Зарезервировать блок новых уникальных ID для книг.
+
+        Верхняя граница выданных ID сохраняется в хранилище: ID не выдаются повторно
+        ни после удаления книг, ни после перезапуска.
+
+        Args:
+            count: int количество ID, например для пакетной вставки
+
+        Returns: range диапазон зарезервированных ID
+        """
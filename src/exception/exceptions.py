@@ -65,3 +65,31 @@ class BookByIdNotFoundError(BaseBookError):
         """
         msg = f'Не найдена книга с ID: {desired_id}'
         super().__init__(msg)
+
+
+class IncompleteBookRecordError(BaseBookError):
+    """Исключение для импортируемой записи, в которой не хватает обязательных полей книги."""
+
+    def __init__(self, missing_fields: list[str]):
+        """
+        Переопределяем конструктор.
+
+        Args:
+            missing_fields: list[str] названия отсутствующих полей
+        """
+        msg = f"В записи не хватает полей книги: {', '.join(missing_fields)}"
+        super().__init__(msg)
+
+
+class MalformedBookRecordError(BaseBookError):
+    """Исключение для импортируемой записи, которую не удалось разобрать."""
+
+    def __init__(self, given_record: str):
+        """
+        Переопределяем конструктор.
+
+        Args:
+            given_record: str исходный текст записи
+        """
+        msg = f'Некорректная запись книги. Дано: `{given_record}`'
+        super().__init__(msg)
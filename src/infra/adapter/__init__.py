@@ -1 +1,2 @@
 from src.infra.adapter.cli_adapter import CliAdapter  # noqa: F401
+from src.infra.adapter.book_importer import BookImporter  # noqa: F401
@@ -0,0 +1,191 @@
+import csv
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterable, Iterator, List, Mapping, Optional, TextIO, Tuple
+
+from src.application.service import BookService
+from src.exception import PublishingYearMustBeNumericError
+from src.exception.exceptions import BaseBookError, IncompleteBookRecordError, MalformedBookRecordError
+from src.infra.config.string_constants import IMPORT_REJECTED_RECORD_MESSAGE, IMPORT_SUMMARY_MESSAGE
+
+BookEntry = Tuple[str, str, int]
+
+
+@dataclass
+class RejectedRecord:
+    line_number: int
+    reason: str
+
+
+@dataclass
+class ImportReport:
+    imported: int = 0
+    rejected: List[RejectedRecord] = field(default_factory=list)
+
+
+class BookImporter:
+    """Потоковый импорт книг из CSV или JSONL файла пакетами ограниченного размера."""
+
+    FORMAT_CSV: str = 'csv'
+    FORMAT_JSONL: str = 'jsonl'
+    DEFAULT_CHUNK_SIZE: int = 1000
+    _REQUIRED_FIELDS: Tuple[str, ...] = ('title', 'author', 'year')
+
+    def __init__(self, book_service: BookService, chunk_size: int = DEFAULT_CHUNK_SIZE):
+        """
+        Инициализация зависимостей.
+
+        Args:
+            book_service: BookService сервис для работы с хранилищем книг
+            chunk_size: int максимальное количество книг в одном пакете сохранения
+        """
+        self.service: BookService = book_service
+        self.chunk_size: int = chunk_size
+
+    def main(self, file_path: str) -> None:
+        """
+        Импортировать файл и вывести итог в консоль.
+
+        Args:
+            file_path: str путь к CSV или JSONL файлу
+        """
+        report: ImportReport = self.import_file(file_path)
+        for rejected in report.rejected:
+            print(IMPORT_REJECTED_RECORD_MESSAGE.format(line_number=rejected.line_number, reason=rejected.reason))
+        print(IMPORT_SUMMARY_MESSAGE.format(imported=report.imported, rejected=len(report.rejected)))
+
+    def import_file(self, file_path: str, file_format: Optional[str] = None) -> ImportReport:
+        """
+        Импортировать книги из файла, не загружая его в память целиком.
+
+        Args:
+            file_path: str путь к файлу
+            file_format: Optional[str] формат файла, по умолчанию определяется по расширению
+
+        Returns:
+            ImportReport: количество добавленных книг и отклоненные записи
+        """
+        file_format = file_format or self._detect_format(file_path)
+        with open(file_path, 'r', encoding='utf-8', newline='') as file1:
+            if file_format == self.FORMAT_CSV:
+                return self.import_records(self._read_csv(file1), self._parse_mapping)
+            return self.import_records(self._read_jsonl(file1), self._parse_json_line)
+
+    def import_records(
+        self,
+        records: Iterable[Tuple[int, Any]],
+        parse_record: Callable[[Any], BookEntry],
+    ) -> ImportReport:
+        """
+        Проверить записи и сохранить корректные пакетами; некорректные записи не прерывают импорт.
+
+        Args:
+            records: Iterable[Tuple[int, Any]] номер строки и исходная запись
+            parse_record: Callable[[Any], BookEntry] преобразование записи в поля книги
+
+        Returns:
+            ImportReport: количество добавленных книг и отклоненные записи
+        """
+        report: ImportReport = ImportReport()
+        chunk: list[BookEntry] = []
+        for line_number, record in records:
+            try:
+                chunk.append(parse_record(record))
+            except BaseBookError as err:
+                report.rejected.append(RejectedRecord(line_number=line_number, reason=str(err)))
+                continue
+            if len(chunk) >= self.chunk_size:
+                report.imported += len(self.service.add_books(chunk))
+                chunk = []
+        if chunk:
+            report.imported += len(self.service.add_books(chunk))
+        return report
+
+    def _detect_format(self, file_path: str) -> str:
+        """
+        Определить формат файла по расширению.
+
+        Args:
+            file_path: str путь к файлу
+
+        Returns:
+            str: FORMAT_CSV для файлов .csv, иначе FORMAT_JSONL
+        """
+        extension: str = os.path.splitext(file_path)[1].lower()
+        return self.FORMAT_CSV if extension == '.csv' else self.FORMAT_JSONL
+
+    @staticmethod
+    def _read_csv(file1: TextIO) -> Iterator[Tuple[int, Any]]:
+        """
+        Читать CSV файл с заголовком построчно.
+
+        Args:
+            file1: TextIO открытый файл
+
+        Yields:
+            Tuple[int, Any]: номер последней строки записи и словарь полей
+        """
+        reader = csv.DictReader(file1)
+        for row in reader:
+            yield reader.line_num, row
+
+    @staticmethod
+    def _read_jsonl(file1: TextIO) -> Iterator[Tuple[int, Any]]:
+        """
+        Читать JSONL файл построчно, пропуская пустые строки.
+
+        Args:
+            file1: TextIO открытый файл
+
+        Yields:
+            Tuple[int, Any]: номер строки и ее текст
+        """
+        for line_number, line in enumerate(file1, start=1):
+            if line.strip():
+                yield line_number, line
+
+    def _parse_json_line(self, line: str) -> BookEntry:
+        """
+        Разобрать строку JSONL в поля книги.
+
+        Args:
+            line: str текст строки
+
+        Returns:
+            BookEntry: заголовок, автор и год издания
+
+        Raises:
+            MalformedBookRecordError: если строка не является JSON объектом
+        """
+        try:
+            record: Any = json.loads(line)
+        except json.JSONDecodeError:
+            raise MalformedBookRecordError(given_record=line.strip())
+        if not isinstance(record, dict):
+            raise MalformedBookRecordError(given_record=line.strip())
+        return self._parse_mapping(record)
+
+    def _parse_mapping(self, record: Mapping[str, Any]) -> BookEntry:
+        """
+        Проверить словарь полей и преобразовать его в поля книги.
+
+        Args:
+            record: Mapping[str, Any] поля записи с ключами title, author и year
+
+        Returns:
+            BookEntry: заголовок, автор и год издания
+
+        Raises:
+            IncompleteBookRecordError: если не хватает обязательных полей
+            PublishingYearMustBeNumericError: если год издания не является числом
+        """
+        missing: list[str] = [name for name in self._REQUIRED_FIELDS if record.get(name) in (None, '')]
+        if missing:
+            raise IncompleteBookRecordError(missing_fields=missing)
+        input_year: str = str(record['year']).strip()
+        try:
+            year: int = int(input_year)
+        except ValueError:
+            raise PublishingYearMustBeNumericError(given_year=input_year)
+        return str(record['title']).strip(), str(record['author']).strip(), year
@@ -1,4 +1,5 @@
 import sys
+from math import ceil
 from typing import Optional
 
 from src.application.service import BookService
@@ -13,6 +14,7 @@ class CliAdapter:
     _HORIZONTAL_LINE: str  = '_' * 80
     _EXIT_STATUS_OK: int = 0
     _EXIT_STATUS_ERROR: int = 1
+    _PAGE_SIZE: int = 20
 
     def __init__(self, book_service: BookService):
         """
@@ -133,14 +135,41 @@ class CliAdapter:
             print(NO_BOOKS_FOUND_MESSAGE)
 
     def _handle_list_books(self) -> None:
-        """Обработка пункта меню: 4. Отобразить все книги."""
-        books: list[Book] = self.service.list_books()
-        if books:
-            print(LOOKUP_RESULT_TITLE)
+        """
+        Обработка пункта меню: 4. Отобразить все книги.
+
+        Книги выводятся постранично: из хранилища загружается и форматируется только текущая страница,
+        поэтому первая страница появляется сразу при любом размере каталога.
+        """
+        total: int = self.service.count_books()
+        if not total:
+            print(NO_BOOKS_FOUND_MESSAGE)
+            return
+
+        pages: int = ceil(total / self._PAGE_SIZE)
+        page_number: int = 1
+        books: list[Book] = self.service.get_books_page(self._PAGE_SIZE)
+        while books:
+            print(LOOKUP_RESULT_TITLE.format(page=page_number, pages=pages))
             for book in books:
                 print(book)
-        else:
-            print(NO_BOOKS_FOUND_MESSAGE)
+            if pages == 1:
+                return
+
+            command: str = input(INPUT_PAGER_COMMAND).strip().lower()
+            if command == PAGER_QUIT:
+                return
+            if command in {EMPTY_STRING, PAGER_NEXT_PAGE}:
+                if page_number == pages:
+                    return
+                page_number += 1
+                books = self.service.get_books_page(self._PAGE_SIZE, after_id=books[-1].id)
+            elif command == PAGER_PREVIOUS_PAGE or command.isdigit():
+                target_page: int = page_number - 1 if command == PAGER_PREVIOUS_PAGE else int(command)
+                page_number = min(max(target_page, 1), pages)
+                books = self.service.get_books_page(self._PAGE_SIZE, offset=(page_number - 1) * self._PAGE_SIZE)
+            else:
+                print(INCORRECT_PAGER_COMMAND_MESSAGE)
 
     def _handle_set_status(self) -> None:
         """"
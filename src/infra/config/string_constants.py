@@ -10,7 +10,12 @@ BOOK_MENU = """\n--- Меню библиотеки ---
 INCORRECT_MAIN_MENU_OPTION_MESSAGE = 'Некорректный ввод пункта. Выберите число от 1 до 6 включительно.'
 STATUS_SUCCESSFULLY_UPDATED = 'Статус книги успешно обновлен'
 INPUT_ID_FOR_UPDATE = 'Введите ID книги для обновления: '
-LOOKUP_RESULT_TITLE = '\n--- Доступные книги ---'
+LOOKUP_RESULT_TITLE = '\n--- Доступные книги (страница {page} из {pages}) ---'
+INPUT_PAGER_COMMAND = 'Enter или n - следующая страница, p - предыдущая, номер - перейти к странице, q - в меню: '
+INCORRECT_PAGER_COMMAND_MESSAGE = 'Некорректная команда. Введите n, p, q или номер страницы.'
+PAGER_NEXT_PAGE = 'n'
+PAGER_PREVIOUS_PAGE = 'p'
+PAGER_QUIT = 'q'
 SEARCH_RESULT_TITLE = '\n--- Результат поиска ---'
 NO_BOOKS_FOUND_MESSAGE = 'Не найдено книг в хранилище по указанному поисковому запросу'
 BOOK_SUCCESSFULLY_DELETED = 'Книга успешно удалена'
@@ -31,3 +36,5 @@ INPUT_AUTHOR_OR_SKIP = 'Введите автора книги для поиск
 INPUT_TITLE_OR_SKIP = 'Введите заголовок книги для поиска (или нажмите Enter чтобы пропустить): '
 EMPTY_MAIN_MENU_INPUT = "'' is not a valid MenuOption"  # noqa: Q000
 EMPTY_MAIN_MENU_MESSAGE = 'Вы ввели пустую строку'
+IMPORT_SUMMARY_MESSAGE = 'Импорт завершен. Добавлено книг: {imported}, отклонено записей: {rejected}'
+IMPORT_REJECTED_RECORD_MESSAGE = 'Строка {line_number}: {reason}'
@@ -1 +1,4 @@
 from src.infra.repository.json_book_repository import JsonBookRepository  # noqa: F401, I001, I005
+from src.infra.repository.sqlite_book_repository import SqliteBookRepository  # noqa: F401, I001, I005
+from src.infra.repository.binary_book_repository import BinaryBookRepository  # noqa: F401, I001, I005
+from src.infra.repository.thread_safe_book_repository import ThreadSafeBookRepository  # noqa: F401, I001, I005
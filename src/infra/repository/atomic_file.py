@@ -0,0 +1,24 @@
+import json
+import os
+from typing import Any, Optional
+
+_TEMP_SUFFIX: str = '.tmp'
+
+
+def atomic_write_json(file_path: str, data: Any, indent: Optional[int] = None) -> None:
+    """
+    Атомарно заменить JSON файл: запись во временный файл, fsync и переименование.
+
+    При аварийном завершении на диске остается либо старая, либо новая версия файла целиком.
+
+    Args:
+        file_path: str путь к JSON файлу
+        data: Any данные, сериализуемые в JSON
+        indent: Optional[int] отступ форматирования JSON
+    """
+    temp_path: str = file_path + _TEMP_SUFFIX
+    with open(temp_path, 'w') as file1:
+        json.dump(data, file1, indent=indent)
+        file1.flush()
+        os.fsync(file1.fileno())
+    os.replace(temp_path, file_path)
@@ -0,0 +1,481 @@
+import mmap
+import os
+import struct
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from src.domain.entity import Book
+from src.domain.repository import BaseBookRepository
+from src.exception.exceptions import IncorrectBookStatusError
+from src.infra.repository.columnar_book_store import ColumnarBookStore
+
+
+class BinaryBookRepository(BaseBookRepository):
+    """
+    Хранилище книг в бинарном файле, открываемом через mmap.
+
+    Файл каталога - заголовок и таблица записей фиксированной длины (ID, год, статус, смещения строк),
+    рядом лежит куча строк `<file>.heap` с заголовками и авторами в UTF-8. При открытии читается
+    только заголовок, поэтому запуск не зависит от размера каталога; записи декодируются по запросу.
+    Записи упорядочены по ID, пока ID добавляются по возрастанию, и тогда поиск по ID - бинарный.
+    Удаленные записи помечаются статусом-надгробием.
+    """
+
+    HEAP_SUFFIX: str = '.heap'
+    _MAGIC: bytes = b'BOOKBIN1'
+    _HEADER: struct.Struct = struct.Struct('<8sIIIQ4x')
+    _RECORD: struct.Struct = struct.Struct('<iiB3xQIQI')
+    _RECORD_ID: struct.Struct = struct.Struct('<i')
+    _STATUS_OFFSET: int = 8
+    _FLAG_SORTED: int = 1
+    _DELETED: int = 0xFF
+
+    def __init__(self, file_path: str):
+        """
+        Открыть (или создать) бинарный каталог.
+
+        Args:
+            file_path: str путь к файлу таблицы записей
+        """
+        self.file_path: str = file_path
+        self.heap_path: str = file_path + self.HEAP_SUFFIX
+        if not os.path.exists(file_path):
+            with open(file_path, 'wb') as file1:
+                file1.write(self._HEADER.pack(self._MAGIC, self._FLAG_SORTED, 0, 0, 0))
+        self._records_fd: int = os.open(file_path, os.O_RDWR)
+        self._heap_fd: int = os.open(self.heap_path, os.O_RDWR | os.O_CREAT)
+        header: bytes = os.pread(self._records_fd, self._HEADER.size, 0)
+        magic, self._flags, self._record_count, self._live_count, self._last_id = self._HEADER.unpack(header)
+        if magic != self._MAGIC:
+            raise ValueError(f'Файл {file_path} не является бинарным каталогом книг')
+        self._heap_size: int = os.fstat(self._heap_fd).st_size
+        self._records_map: Optional[mmap.mmap] = None
+        self._heap_map: Optional[mmap.mmap] = None
+        self._author_offsets: dict[str, Tuple[int, int]] = {}
+
+    @property
+    def last_id(self) -> int:
+        """
+        Верхняя граница уже выданных ID.
+
+        Returns:
+            int: наибольший зарезервированный или сохраненный ID
+        """
+        return self._last_id
+
+    def add_book(self, book: Book) -> None:
+        """
+        Добавить книгу в каталог.
+
+        Args:
+            book: Book сущность Book для сохранения
+        """
+        self.add_books([book])
+
+    def add_books(self, books: Iterable[Book]) -> None:
+        """
+        Добавить пакет книг: записи и строки дописываются одной операцией записи в каждый файл.
+
+        Args:
+            books: Iterable[Book] сущности Book для сохранения
+        """
+        records: bytearray = bytearray()
+        heap: bytearray = bytearray()
+        updates: list[Book] = []
+        appended_ids: set[int] = set()
+        last_record_id: Optional[int] = self._id_at(self._record_count - 1) if self._record_count else None
+        for book in books:
+            self._last_id = max(self._last_id, book.id)
+            if book.id in appended_ids or self._find_row(book.id, include_deleted=True) is not None:
+                updates.append(book)
+                continue
+            if last_record_id is not None and book.id <= last_record_id:
+                self._flags &= ~self._FLAG_SORTED
+            last_record_id = book.id
+            records += self._pack_record(book, heap)
+            appended_ids.add(book.id)
+        if records:
+            os.pwrite(self._heap_fd, heap, self._heap_size - len(heap))
+            os.pwrite(self._records_fd, records, self._record_offset(self._record_count))
+            self._record_count += len(appended_ids)
+            self._live_count += len(appended_ids)
+            self._drop_maps()
+        # Существующие записи перезаписываются после дописывания пакета, чтобы куча пакета осталась непрерывной
+        for book in updates:
+            self._write_record(self._find_row(book.id, include_deleted=True), book)
+        self._write_header()
+
+    def delete_book_by_id(self, book_id: int) -> None:
+        """
+        Удалить книгу из каталога, пометив ее запись надгробием.
+
+        Args:
+            book_id: int ID книги для удаления
+        """
+        row: Optional[int] = self._find_row(book_id)
+        if row is None:
+            return
+        os.pwrite(self._records_fd, bytes((self._DELETED,)), self._record_offset(row) + self._STATUS_OFFSET)
+        self._live_count -= 1
+        self._write_header()
+
+    def get_book_by_id(self, book_id: int) -> Optional[Book]:
+        """
+        Получить книгу по ID, декодировав только ее запись.
+
+        Args:
+            book_id: int ID книги
+
+        Returns:
+            Optional[Book] найденная книга по ID или None если не найдена
+        """
+        row: Optional[int] = self._find_row(book_id)
+        return None if row is None else self._book_at(row)
+
+    def search_books(
+        self,
+        title: Optional[str] = None,
+        author: Optional[str] = None,
+        year: Optional[int] = None,
+    ) -> List[Book]:
+        """
+        Найти книги по заголовку, автору и году издания, критерии объединяются через И.
+
+        Сначала проверяется год из записи фиксированной длины, строки декодируются только при необходимости.
+
+        Args:
+            title: Optional[str] подстрока заголовка
+            author: Optional[str] подстрока автора
+            year: Optional[int] год издания
+
+        Returns:
+            list[Book]: список книг подпадающих под поисковый критерий, упорядоченный по ID
+        """
+        title_query: str = title.lower() if title else ''
+        author_query: str = author.lower() if author else ''
+        result: list[Book] = []
+        for row in self._live_rows():
+            book_id, book_year, status, title_offset, title_length, author_offset, author_length = self._record_at(row)
+            if year and book_year != year:
+                continue
+            book_title: str = self._string_at(title_offset, title_length)
+            if title_query and title_query not in book_title.lower():
+                continue
+            book_author: str = self._string_at(author_offset, author_length)
+            if author_query and author_query not in book_author.lower():
+                continue
+            result.append(self._to_book(book_id, book_title, book_author, book_year, status))
+        if not self._flags & self._FLAG_SORTED:
+            result.sort(key=lambda book: book.id)
+        return result
+
+    def list_books(self) -> List[Book]:
+        """
+        Загрузить все книги каталога.
+
+        Returns:
+            list[Book]: список книг, упорядоченный по ID, или пустой список
+        """
+        return self.search_books()
+
+    def list_books_page(self, limit: int, after_id: int = 0, offset: int = 0) -> List[Book]:
+        """
+        Получить страницу книг по возрастанию ID, декодируя только записи страницы.
+
+        Args:
+            limit: int максимальное количество книг на странице
+            after_id: int вернуть только книги с ID больше указанного
+            offset: int пропустить указанное количество книг после курсора
+
+        Returns:
+            list[Book]: книги страницы
+        """
+        if not self._flags & self._FLAG_SORTED:
+            books: list[Book] = [book for book in self.list_books() if book.id > after_id]
+            return books[offset:offset + limit]
+        page: list[Book] = []
+        for row in self._live_rows(self._lower_bound(after_id + 1)):
+            if offset:
+                offset -= 1
+                continue
+            if len(page) == limit:
+                break
+            page.append(self._book_at(row))
+        return page
+
+    def count_books(self) -> int:
+        """
+        Количество книг из заголовка каталога.
+
+        Returns:
+            int: количество книг
+        """
+        return self._live_count
+
+    def update_book(self, book: Book) -> None:
+        """
+        Перезаписать запись книги на месте; измененные строки дописываются в кучу.
+
+        Args:
+            book: Book сущность Book
+        """
+        row: Optional[int] = self._find_row(book.id)
+        if row is not None:
+            self._write_record(row, book)
+
+    def reserve_ids(self, count: int = 1) -> range:
+        """
+        Зарезервировать блок новых уникальных ID, верхняя граница хранится в заголовке каталога.
+
+        Args:
+            count: int количество ID
+
+        Returns:
+            range: зарезервированные ID
+
+        Raises:
+            ValueError: если count меньше единицы
+        """
+        if count < 1:
+            raise ValueError(f'Количество резервируемых ID должно быть положительным. Дано: {count}')
+        first_id: int = self._last_id + 1
+        self._last_id += count
+        self._write_header()
+        return range(first_id, self._last_id + 1)
+
+    def close(self) -> None:
+        """Закрыть отображения в память и файлы каталога."""
+        self._drop_maps()
+        os.close(self._records_fd)
+        os.close(self._heap_fd)
+
+    def _write_record(self, row: int, book: Book) -> None:
+        """
+        Перезаписать запись на месте, восстановив ее, если она была удалена.
+
+        Args:
+            row: int номер записи
+            book: Book новые значения полей
+        """
+        was_deleted: bool = self._record_at(row)[2] == self._DELETED
+        heap: bytearray = bytearray()
+        record: bytes = self._pack_record(book, heap)
+        if heap:
+            os.pwrite(self._heap_fd, heap, self._heap_size - len(heap))
+            self._drop_maps()
+        os.pwrite(self._records_fd, record, self._record_offset(row))
+        if was_deleted:
+            self._live_count += 1
+            self._write_header()
+
+    def _pack_record(self, book: Book, heap: bytearray) -> bytes:
+        """
+        Упаковать запись книги, дописав ее строки в буфер кучи.
+
+        Args:
+            book: Book сущность Book
+            heap: bytearray буфер строк, который будет дописан в конец кучи
+
+        Returns:
+            bytes: запись фиксированной длины
+
+        Raises:
+            IncorrectBookStatusError: если у книги неизвестный статус
+        """
+        status_code: Optional[int] = ColumnarBookStore.STATUS_CODES.get(book.status)
+        if status_code is None:
+            raise IncorrectBookStatusError(book.status)
+        title_offset, title_length = self._append_string(book.title, heap)
+        author_location: Optional[Tuple[int, int]] = self._author_offsets.get(book.author)
+        if author_location is None:
+            author_location = self._append_string(book.author, heap)
+            self._author_offsets[book.author] = author_location
+        author_offset, author_length = author_location
+        return self._RECORD.pack(
+            book.id, book.year, status_code, title_offset, title_length, author_offset, author_length,
+        )
+
+    def _append_string(self, text: str, heap: bytearray) -> Tuple[int, int]:
+        """
+        Дописать строку в буфер кучи.
+
+        Args:
+            text: str строка
+            heap: bytearray буфер строк
+
+        Returns:
+            Tuple[int, int]: смещение строки в куче и ее длина в байтах
+        """
+        encoded: bytes = text.encode('utf-8')
+        offset: int = self._heap_size
+        heap += encoded
+        self._heap_size += len(encoded)
+        return offset, len(encoded)
+
+    def _find_row(self, book_id: int, include_deleted: bool = False) -> Optional[int]:
+        """
+        Найти номер записи по ID: бинарным поиском в упорядоченном каталоге, иначе перебором.
+
+        Args:
+            book_id: int ID книги
+            include_deleted: bool находить и удаленные записи
+
+        Returns:
+            Optional[int]: номер записи или None
+        """
+        if self._flags & self._FLAG_SORTED:
+            row: int = self._lower_bound(book_id)
+            candidates: Iterable[int] = (row,) if row < self._record_count else ()
+        else:
+            candidates = range(self._record_count)
+        for candidate in candidates:
+            if self._id_at(candidate) != book_id:
+                continue
+            if include_deleted or self._record_at(candidate)[2] != self._DELETED:
+                return candidate
+            return None
+        return None
+
+    def _lower_bound(self, book_id: int) -> int:
+        """
+        Найти первую запись с ID не меньше указанного в упорядоченном каталоге.
+
+        Args:
+            book_id: int ID книги
+
+        Returns:
+            int: номер записи
+        """
+        low: int = 0
+        high: int = self._record_count
+        while low < high:
+            middle: int = (low + high) // 2
+            if self._id_at(middle) < book_id:
+                low = middle + 1
+            else:
+                high = middle
+        return low
+
+    def _live_rows(self, start: int = 0) -> Iterator[int]:
+        """
+        Перебрать номера неудаленных записей.
+
+        Args:
+            start: int номер записи, с которой начать
+
+        Yields:
+            int: номер записи
+        """
+        records: mmap.mmap = self._records()
+        for row in range(start, self._record_count):
+            if records[self._record_offset(row) + self._STATUS_OFFSET] != self._DELETED:
+                yield row
+
+    def _id_at(self, row: int) -> int:
+        """
+        Прочитать ID записи без декодирования остальных полей.
+
+        Args:
+            row: int номер записи
+
+        Returns:
+            int: ID книги
+        """
+        return self._RECORD_ID.unpack_from(self._records(), self._record_offset(row))[0]
+
+    def _record_at(self, row: int) -> tuple:
+        """
+        Декодировать запись фиксированной длины.
+
+        Args:
+            row: int номер записи
+
+        Returns:
+            tuple: ID, год, код статуса, смещение и длина заголовка, смещение и длина автора
+        """
+        return self._RECORD.unpack_from(self._records(), self._record_offset(row))
+
+    def _book_at(self, row: int) -> Book:
+        """
+        Декодировать книгу из записи и кучи строк.
+
+        Args:
+            row: int номер записи
+
+        Returns:
+            Book: сущность Book
+        """
+        book_id, year, status, title_offset, title_length, author_offset, author_length = self._record_at(row)
+        return self._to_book(
+            book_id, self._string_at(title_offset, title_length), self._string_at(author_offset, author_length),
+            year, status,
+        )
+
+    @staticmethod
+    def _to_book(book_id: int, title: str, author: str, year: int, status: int) -> Book:
+        """
+        Создать сущность Book из декодированных полей.
+
+        Args:
+            book_id: int ID книги
+            title: str заголовок
+            author: str автор
+            year: int год издания
+            status: int код статуса
+
+        Returns:
+            Book: сущность Book
+        """
+        return Book(id=book_id, title=title, author=author, year=year, _status=ColumnarBookStore.STATUS_NAMES[status])
+
+    def _string_at(self, offset: int, length: int) -> str:
+        """
+        Прочитать строку из кучи.
+
+        Args:
+            offset: int смещение строки
+            length: int длина строки в байтах
+
+        Returns:
+            str: декодированная строка
+        """
+        if not length:
+            return ''
+        if self._heap_map is None:
+            self._heap_map = mmap.mmap(self._heap_fd, 0, access=mmap.ACCESS_READ)
+        return self._heap_map[offset:offset + length].decode('utf-8')
+
+    def _records(self) -> mmap.mmap:
+        """
+        Получить отображение таблицы записей, пересоздав его после дописывания.
+
+        Returns:
+            mmap.mmap: отображение файла таблицы записей
+        """
+        if self._records_map is None:
+            self._records_map = mmap.mmap(self._records_fd, 0, access=mmap.ACCESS_READ)
+        return self._records_map
+
+    def _drop_maps(self) -> None:
+        """Закрыть отображения, чтобы следующее чтение увидело новый размер файлов."""
+        for mapped in (self._records_map, self._heap_map):
+            if mapped is not None:
+                mapped.close()
+        self._records_map = None
+        self._heap_map = None
+
+    def _record_offset(self, row: int) -> int:
+        """
+        Смещение записи в файле таблицы.
+
+        Args:
+            row: int номер записи
+
+        Returns:
+            int: смещение в байтах
+        """
+        return self._HEADER.size + row * self._RECORD.size
+
+    def _write_header(self) -> None:
+        """Записать заголовок каталога на место."""
+        header: bytes = self._HEADER.pack(self._MAGIC, self._flags, self._record_count, self._live_count, self._last_id)
+        os.pwrite(self._records_fd, header, 0)
@@ -0,0 +1,98 @@
+import json
+import os
+from typing import Iterable, Iterator
+
+
+class BookJournal:
+    """Журнал изменений хранилища книг: одна JSON запись на строку, только дозапись в конец файла."""
+
+    OP_ADD: str = 'add'
+    OP_UPDATE: str = 'update'
+    OP_DELETE: str = 'delete'
+
+    def __init__(self, file_path: str):
+        """
+        Создать журнал изменений рядом со снимком хранилища.
+
+        Args:
+            file_path: str путь к файлу журнала
+        """
+        self.file_path: str = file_path
+
+    def append(self, record: dict) -> None:
+        """
+        Дописать одну запись в конец журнала.
+
+        Args:
+            record: dict запись об изменении, например {"op": "delete", "id": 1}
+        """
+        line: str = json.dumps(record, ensure_ascii=False, separators=(',', ':'))
+        with open(self.file_path, 'a', encoding='utf-8') as file1:
+            file1.write(line + '\n')
+
+    def append_many(self, records: Iterable[dict]) -> None:
+        """
+        Дописать несколько записей в конец журнала одной операцией записи.
+
+        Args:
+            records: Iterable[dict] записи об изменениях
+        """
+        lines: str = ''.join(
+            json.dumps(record, ensure_ascii=False, separators=(',', ':')) + '\n' for record in records
+        )
+        with open(self.file_path, 'a', encoding='utf-8') as file1:
+            file1.write(lines)
+
+    def read_records(self) -> Iterator[dict]:
+        """
+        Прочитать записи журнала по порядку.
+
+        Недописанная последняя строка (например, после аварийного завершения) пропускается.
+
+        Yields:
+            dict: очередная запись журнала
+        """
+        if not os.path.exists(self.file_path):
+            return
+        with open(self.file_path, 'r', encoding='utf-8') as file1:
+            for line in file1:
+                if not line.endswith('\n'):
+                    break
+                yield json.loads(line)
+
+    def size(self) -> int:
+        """
+        Размер журнала в байтах.
+
+        Returns:
+            int: размер файла журнала или 0, если журнала нет
+        """
+        try:
+            return os.path.getsize(self.file_path)
+        except FileNotFoundError:
+            return 0
+
+    def exists(self) -> bool:
+        """
+        Проверить существует ли файл журнала.
+
+        Returns:
+            bool: True если файл журнала существует
+        """
+        return os.path.exists(self.file_path)
+
+    def rotate(self, target_path: str) -> None:
+        """
+        Переименовать текущий журнал, чтобы новые записи попадали в пустой журнал.
+
+        Args:
+            target_path: str новый путь для накопленного журнала
+        """
+        os.replace(self.file_path, target_path)
+
+    def remove(self) -> None:
+        """Удалить файл журнала, если он существует."""
+        try:
+            os.remove(self.file_path)
+        except FileNotFoundError:
+            return
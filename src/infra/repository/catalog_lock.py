@@ -0,0 +1,79 @@
+import os
+import struct
+from contextlib import contextmanager
+from threading import RLock
+from typing import Iterator
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - на Windows блокировка между процессами недоступна
+    fcntl = None
+
+
+class CatalogLock:
+    """
+    Межпроцессная блокировка каталога и счетчик версий.
+
+    Блокировка - рекомендательная `fcntl.flock` на отдельном файле рядом с каталогом. В первых
+    восьми байтах этого файла хранится номер версии каталога: каждый процесс увеличивает его
+    после фиксации изменения, а остальные сравнивают его со своей версией одним `pread`
+    и перечитывают каталог только тогда, когда номер изменился.
+    """
+
+    _VERSION: struct.Struct = struct.Struct('<Q')
+
+    def __init__(self, file_path: str):
+        """
+        Открыть (или создать) файл блокировки.
+
+        Args:
+            file_path: str путь к файлу блокировки
+        """
+        self.file_path: str = file_path
+        self._fd: int = os.open(file_path, os.O_RDWR | os.O_CREAT, 0o644)
+        self._thread_lock: RLock = RLock()
+        self._depth: int = 0
+
+    @contextmanager
+    def exclusive(self) -> Iterator[None]:
+        """
+        Захватить исключительную блокировку; повторный захват тем же потоком не блокируется.
+
+        Yields:
+            None
+        """
+        with self._thread_lock:
+            if not self._depth and fcntl is not None:
+                fcntl.flock(self._fd, fcntl.LOCK_EX)
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if not self._depth and fcntl is not None:
+                    fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    def version(self) -> int:
+        """
+        Прочитать текущую версию каталога.
+
+        Returns:
+            int: номер версии, 0 для нового каталога
+        """
+        data: bytes = os.pread(self._fd, self._VERSION.size, 0)
+        return self._VERSION.unpack(data)[0] if len(data) == self._VERSION.size else 0
+
+    def bump_version(self) -> int:
+        """
+        Увеличить версию каталога; вызывается под исключительной блокировкой.
+
+        Returns:
+            int: новый номер версии
+        """
+        version: int = self.version() + 1
+        os.pwrite(self._fd, self._VERSION.pack(version), 0)
+        return version
+
+    def close(self) -> None:
+        """Закрыть файл блокировки."""
+        os.close(self._fd)
@@ -0,0 +1,375 @@
+from array import array
+from bisect import bisect_left, bisect_right
+from typing import Iterable, Iterator, List, Optional
+
+from src.domain.entity import Book
+from src.exception.exceptions import IncorrectBookStatusError
+
+
+class ColumnarBookStore:
+    """
+    Компактное колоночное хранение каталога в памяти.
+
+    Каждая книга - строка в параллельных массивах: ID и год в `array('i')`, статус - один байт
+    в `bytearray`, заголовок - срез UTF-8 кучи `bytearray` (смещение и длина), автор - номер
+    в таблице интернированных строк. Строки упорядочены по ID, поэтому поиск строки по ID - это
+    бинарный поиск, а постраничный обход - последовательное чтение. Объекты Book создаются только
+    при выдаче наружу. Удаленные строки помечаются статусом-надгробием и вычищаются при сжатии.
+    """
+
+    STATUS_CODES: dict[str, int] = {'available': 0, 'borrowed': 1}
+    STATUS_NAMES: tuple[str, ...] = ('available', 'borrowed')
+    _DELETED: int = 0xFF
+    _MIN_COMPACTION_ROWS: int = 1024
+
+    def __init__(self, books: Iterable[Book] = ()):
+        """
+        Создать хранилище и загрузить в него книги.
+
+        Args:
+            books: Iterable[Book] начальные книги в любом порядке
+        """
+        self._reset()
+        for book in sorted(books, key=lambda item: item.id):
+            self.put(book)
+
+    def __len__(self) -> int:
+        """
+        Количество книг без учета удаленных строк.
+
+        Returns:
+            int: количество книг
+        """
+        return len(self._ids) - self._deleted_rows
+
+    def __contains__(self, book_id: object) -> bool:
+        """
+        Проверить, есть ли книга с указанным ID.
+
+        Args:
+            book_id: object ID книги
+
+        Returns:
+            bool: True если книга есть в хранилище
+        """
+        return isinstance(book_id, int) and self.row_of(book_id) is not None
+
+    def row_of(self, book_id: int) -> Optional[int]:
+        """
+        Найти номер строки книги по ID бинарным поиском.
+
+        Args:
+            book_id: int ID книги
+
+        Returns:
+            Optional[int]: номер строки или None, если книги нет
+        """
+        row: int = bisect_left(self._ids, book_id)
+        if row < len(self._ids) and self._ids[row] == book_id and self._statuses[row] != self._DELETED:
+            return row
+        return None
+
+    def get(self, book_id: int) -> Optional[Book]:
+        """
+        Получить книгу по ID.
+
+        Args:
+            book_id: int ID книги
+
+        Returns:
+            Optional[Book]: новая сущность Book или None, если книги нет
+        """
+        row: Optional[int] = self.row_of(book_id)
+        return None if row is None else self.book_at(row)
+
+    def put(self, book: Book) -> Optional[Book]:
+        """
+        Добавить книгу или заменить книгу с тем же ID.
+
+        Args:
+            book: Book сущность Book
+
+        Returns:
+            Optional[Book]: предыдущая версия книги или None, если книги не было
+
+        Raises:
+            IncorrectBookStatusError: если у книги неизвестный статус
+        """
+        status_code: Optional[int] = self.STATUS_CODES.get(book.status)
+        if status_code is None:
+            raise IncorrectBookStatusError(book.status)
+        title: bytes = book.title.encode('utf-8')
+        author_code: int = self._intern_author(book.author)
+
+        if not self._ids or self._ids[-1] < book.id:
+            self._append_row(book.id, book.year, status_code, title, author_code)
+            return None
+
+        row: int = bisect_left(self._ids, book.id)
+        if row == len(self._ids) or self._ids[row] != book.id:
+            self._insert_row(row, book.id, book.year, status_code, title, author_code)
+            return None
+
+        previous: Optional[Book] = None
+        if self._statuses[row] == self._DELETED:
+            self._deleted_rows -= 1
+            self._garbage_bytes -= self._title_lengths[row]
+        else:
+            previous = self.book_at(row)
+        if self._title_at_bytes(row) != title:
+            self._garbage_bytes += self._title_lengths[row]
+            self._title_offsets[row] = len(self._title_heap)
+            self._title_lengths[row] = len(title)
+            self._title_heap += title
+        self._years[row] = book.year
+        self._statuses[row] = status_code
+        self._author_codes[row] = author_code
+        self._compact_if_needed()
+        return previous
+
+    def delete(self, book_id: int) -> Optional[Book]:
+        """
+        Удалить книгу по ID.
+
+        Args:
+            book_id: int ID книги
+
+        Returns:
+            Optional[Book]: удаленная книга или None, если книги не было
+        """
+        row: Optional[int] = self.row_of(book_id)
+        if row is None:
+            return None
+        removed: Book = self.book_at(row)
+        self._statuses[row] = self._DELETED
+        self._deleted_rows += 1
+        self._garbage_bytes += self._title_lengths[row]
+        self._compact_if_needed()
+        return removed
+
+    def rows(self, start: int = 0) -> Iterator[int]:
+        """
+        Перебрать номера строк существующих книг по возрастанию ID.
+
+        Args:
+            start: int номер строки, с которой начать
+
+        Yields:
+            int: номер строки
+        """
+        statuses: bytearray = self._statuses
+        for row in range(start, len(self._ids)):
+            if statuses[row] != self._DELETED:
+                yield row
+
+    def books(self) -> Iterator[Book]:
+        """
+        Перебрать книги по возрастанию ID, создавая сущности Book по одной.
+
+        Yields:
+            Book: очередная книга
+        """
+        for row in self.rows():
+            yield self.book_at(row)
+
+    def page(self, limit: int, after_id: int = 0, offset: int = 0) -> List[Book]:
+        """
+        Получить страницу книг по возрастанию ID.
+
+        Args:
+            limit: int максимальное количество книг
+            after_id: int вернуть только книги с ID больше указанного
+            offset: int пропустить указанное количество книг после курсора
+
+        Returns:
+            list[Book]: книги страницы
+        """
+        start: int = bisect_right(self._ids, after_id)
+        if not self._deleted_rows:
+            return [self.book_at(row) for row in range(start + offset, min(start + offset + limit, len(self._ids)))]
+        page: list[Book] = []
+        for row in self.rows(start):
+            if offset:
+                offset -= 1
+                continue
+            if len(page) == limit:
+                break
+            page.append(self.book_at(row))
+        return page
+
+    def max_id(self) -> int:
+        """
+        Наибольший ID среди существующих книг.
+
+        Returns:
+            int: наибольший ID или 0 для пустого хранилища
+        """
+        for row in range(len(self._ids) - 1, -1, -1):
+            if self._statuses[row] != self._DELETED:
+                return self._ids[row]
+        return 0
+
+    def book_at(self, row: int) -> Book:
+        """
+        Создать сущность Book из строки хранилища.
+
+        Args:
+            row: int номер строки
+
+        Returns:
+            Book: новая сущность Book
+        """
+        return Book(
+            id=self._ids[row],
+            title=self.title_at(row),
+            author=self._authors[self._author_codes[row]],
+            year=self._years[row],
+            _status=self.STATUS_NAMES[self._statuses[row]],
+        )
+
+    def title_at(self, row: int) -> str:
+        """
+        Прочитать заголовок книги из кучи строк.
+
+        Args:
+            row: int номер строки
+
+        Returns:
+            str: заголовок книги
+        """
+        return self._title_at_bytes(row).decode('utf-8')
+
+    def author_at(self, row: int) -> str:
+        """
+        Прочитать автора книги.
+
+        Args:
+            row: int номер строки
+
+        Returns:
+            str: автор книги
+        """
+        return self._authors[self._author_codes[row]]
+
+    def year_at(self, row: int) -> int:
+        """
+        Прочитать год издания книги.
+
+        Args:
+            row: int номер строки
+
+        Returns:
+            int: год издания
+        """
+        return self._years[row]
+
+    def nbytes(self) -> int:
+        """
+        Оценить объем памяти, занимаемый колонками и таблицей авторов.
+
+        Returns:
+            int: размер в байтах
+        """
+        columns: tuple = (
+            self._ids, self._years, self._title_offsets, self._title_lengths, self._author_codes,
+        )
+        column_bytes: int = sum(column.itemsize * len(column) for column in columns)
+        author_bytes: int = sum(len(author.encode('utf-8')) for author in self._authors)
+        return column_bytes + len(self._statuses) + len(self._title_heap) + author_bytes
+
+    def compact(self) -> None:
+        """Вычистить удаленные строки и неиспользуемые байты кучи заголовков."""
+        live_books: list[Book] = list(self.books())
+        self._reset()
+        for book in live_books:
+            self.put(book)
+
+    def _reset(self) -> None:
+        """Создать пустые колонки."""
+        self._ids: array = array('i')
+        self._years: array = array('i')
+        self._statuses: bytearray = bytearray()
+        self._title_heap: bytearray = bytearray()
+        self._title_offsets: array = array('I')
+        self._title_lengths: array = array('I')
+        self._author_codes: array = array('i')
+        self._authors: list[str] = []
+        self._author_lookup: dict[str, int] = {}
+        self._deleted_rows: int = 0
+        self._garbage_bytes: int = 0
+
+    def _append_row(self, book_id: int, year: int, status_code: int, title: bytes, author_code: int) -> None:
+        """
+        Добавить строку в конец колонок.
+
+        Args:
+            book_id: int ID книги
+            year: int год издания
+            status_code: int код статуса
+            title: bytes заголовок в UTF-8
+            author_code: int номер автора в таблице авторов
+        """
+        self._ids.append(book_id)
+        self._years.append(year)
+        self._statuses.append(status_code)
+        self._title_offsets.append(len(self._title_heap))
+        self._title_lengths.append(len(title))
+        self._title_heap += title
+        self._author_codes.append(author_code)
+
+    def _insert_row(self, row: int, book_id: int, year: int, status_code: int, title: bytes, author_code: int) -> None:
+        """
+        Вставить строку в середину колонок, сохраняя порядок по ID.
+
+        Args:
+            row: int позиция вставки
+            book_id: int ID книги
+            year: int год издания
+            status_code: int код статуса
+            title: bytes заголовок в UTF-8
+            author_code: int номер автора в таблице авторов
+        """
+        self._ids.insert(row, book_id)
+        self._years.insert(row, year)
+        self._statuses.insert(row, status_code)
+        self._title_offsets.insert(row, len(self._title_heap))
+        self._title_lengths.insert(row, len(title))
+        self._title_heap += title
+        self._author_codes.insert(row, author_code)
+
+    def _title_at_bytes(self, row: int) -> bytearray:
+        """
+        Прочитать байты заголовка из кучи строк.
+
+        Args:
+            row: int номер строки
+
+        Returns:
+            bytearray: заголовок в UTF-8
+        """
+        start: int = self._title_offsets[row]
+        return self._title_heap[start:start + self._title_lengths[row]]
+
+    def _intern_author(self, author: str) -> int:
+        """
+        Получить номер автора в таблице авторов, добавив его при первом появлении.
+
+        Args:
+            author: str автор книги
+
+        Returns:
+            int: номер автора
+        """
+        author_code: Optional[int] = self._author_lookup.get(author)
+        if author_code is None:
+            author_code = len(self._authors)
+            self._authors.append(author)
+            self._author_lookup[author] = author_code
+        return author_code
+
+    def _compact_if_needed(self) -> None:
+        """Сжать хранилище, когда удаленные строки или устаревшие заголовки занимают заметную долю памяти."""
+        if len(self._ids) < self._MIN_COMPACTION_ROWS:
+            return
+        if self._deleted_rows * 4 > len(self._ids) or self._garbage_bytes * 2 > len(self._title_heap):
+            self.compact()
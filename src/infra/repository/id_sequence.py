@@ -0,0 +1,64 @@
+import json
+import os
+
+from src.infra.repository.atomic_file import atomic_write_json
+
+
+class IdSequence:
+    """
+    Монотонная последовательность ID книг с сохраняемой на диск верхней границей.
+
+    Выданные ID никогда не выдаются повторно, в том числе после удаления книг и перезапуска.
+    """
+
+    def __init__(self, file_path: str):
+        """
+        Загрузить последовательность из файла или начать новую.
+
+        Args:
+            file_path: str путь к JSON файлу с последним выданным ID
+        """
+        self.file_path: str = file_path
+        self.last_id: int = 0
+        self.reload()
+
+    def reload(self) -> None:
+        """Перечитать верхнюю границу с диска, например после резервирования ID другим процессом."""
+        if os.path.exists(self.file_path):
+            with open(self.file_path, 'r') as file1:
+                self.last_id = json.load(file1)['last_id']
+
+    def observe(self, book_id: int) -> None:
+        """
+        Учесть ID, выданный в обход последовательности, чтобы он не был выдан повторно.
+
+        Args:
+            book_id: int ID существующей книги
+        """
+        if book_id > self.last_id:
+            self.last_id = book_id
+            self._save()
+
+    def reserve(self, count: int = 1) -> range:
+        """
+        Зарезервировать блок подряд идущих ID.
+
+        Args:
+            count: int количество ID
+
+        Returns:
+            range: зарезервированные ID
+
+        Raises:
+            ValueError: если count меньше единицы
+        """
+        if count < 1:
+            raise ValueError(f'Количество резервируемых ID должно быть положительным. Дано: {count}')
+        first_id: int = self.last_id + 1
+        self.last_id += count
+        self._save()
+        return range(first_id, self.last_id + 1)
+
+    def _save(self) -> None:
+        """Сохранить верхнюю границу последовательности на диск."""
+        atomic_write_json(self.file_path, {'last_id': self.last_id})
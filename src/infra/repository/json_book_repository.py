@@ -1,25 +1,58 @@
 import json
 import os
-from copy import deepcopy
-from typing import List, Optional
+from contextlib import contextmanager
+from threading import Thread
+from typing import Iterable, Iterator, List, Optional
 
 from src.domain.entity import Book
 from src.domain.repository import BaseBookRepository
+from src.infra.repository.atomic_file import atomic_write_json
+from src.infra.repository.book_journal import BookJournal
+from src.infra.repository.catalog_lock import CatalogLock
+from src.infra.repository.columnar_book_store import ColumnarBookStore
+from src.infra.repository.id_sequence import IdSequence
+from src.infra.repository.ngram_index import NgramIndex
 
 
 class JsonBookRepository(BaseBookRepository):
     _DEFAULT_INDENT: int = 4
+    _JOURNAL_SUFFIX: str = '.journal'
+    _COMPACTING_JOURNAL_SUFFIX: str = '.journal.compacting'
+    SEQUENCE_SUFFIX: str = '.sequence'
+    LOCK_SUFFIX: str = '.lock'
+    DEFAULT_COMPACTION_THRESHOLD: int = 1024 * 1024
 
-    def __init__(self, file_path: str):
+    def __init__(
+        self,
+        file_path: str,
+        journaled: bool = False,
+        compaction_threshold: int = DEFAULT_COMPACTION_THRESHOLD,
+    ):
         """
         Создать репозиторий, хранящий книги в JSON файлах.
 
+        В режиме журнала изменения не переписывают весь файл, а дописываются короткими записями
+        в журнал рядом со снимком. При открытии журнал применяется поверх снимка, а когда журнал
+        превышает порог, он сворачивается в новый снимок в фоновом потоке.
+
+        Один каталог могут использовать несколько процессов: изменения выполняются под блокировкой
+        `fcntl` и увеличивают номер версии в файле `<file>.lock`. Перед каждым обращением процесс
+        сравнивает этот номер со своим и перечитывает каталог, только если его изменил другой процесс.
+
         Args:
             file_path: str путь к JSON файлу для хранения книг
+            journaled: bool включить режим журнала вместо перезаписи всего файла при каждом изменении
+            compaction_threshold: int размер журнала в байтах, после которого он сворачивается в снимок
         """
         self.file_path: str = file_path
-        self._ensure_file_exists()
-        self.books: list[Book] = self._read_books()
+        self.journaled: bool = journaled
+        self.compaction_threshold: int = compaction_threshold
+        self._journal: BookJournal = BookJournal(file_path + self._JOURNAL_SUFFIX)
+        self._compacting_journal: BookJournal = BookJournal(file_path + self._COMPACTING_JOURNAL_SUFFIX)
+        self._compaction_thread: Optional[Thread] = None
+        self._lock: CatalogLock = CatalogLock(file_path + self.LOCK_SUFFIX)
+        self._version: Optional[int] = None
+        self._refresh_if_stale()
 
     def add_book(self, book: Book) -> None:
         """
@@ -28,8 +61,35 @@ class JsonBookRepository(BaseBookRepository):
         Args:
             book: Book сущность Book для сохранения в JSON файл
         """
-        self.books.append(book)
-        self._write_books(self.books)
+        with self._write_transaction():
+            self._id_sequence.observe(book.id)
+            self._store_book(book)
+            if self.journaled:
+                self._append_to_journal({'op': BookJournal.OP_ADD, 'book': self._to_record(book)})
+            else:
+                self._write_books(self._store.books())
+
+    def add_books(self, books: Iterable[Book]) -> None:
+        """
+        Добавить пакет книг в хранилище одной записью в файл или журнал.
+
+        Args:
+            books: Iterable[Book] сущности Book для сохранения
+        """
+        books = list(books)
+        if not books:
+            return
+        with self._write_transaction():
+            records: list[dict] = []
+            for book in books:
+                self._store_book(book)
+                records.append({'op': BookJournal.OP_ADD, 'book': self._to_record(book)})
+            self._id_sequence.observe(max(book.id for book in books))
+            if self.journaled:
+                self._journal.append_many(records)
+                self._compact_if_needed()
+            else:
+                self._write_books(self._store.books())
 
     def delete_book_by_id(self, book_id: int) -> None:
         """
@@ -38,8 +98,15 @@ class JsonBookRepository(BaseBookRepository):
         Args:
             book_id: int ID книги для удаления
         """
-        self.books = [book for book in self.books if book.id != book_id]
-        self._write_books(self.books)
+        with self._write_transaction():
+            book: Optional[Book] = self._store.delete(book_id)
+            if book is None:
+                return
+            self._unindex_book(book)
+            if self.journaled:
+                self._append_to_journal({'op': BookJournal.OP_DELETE, 'id': book_id})
+            else:
+                self._write_books(self._store.books())
 
     def get_book_by_id(self, book_id: int) -> Optional[Book]:
         """
@@ -49,12 +116,10 @@ class JsonBookRepository(BaseBookRepository):
             book_id: int ID книги для удаления
 
         Returns:
-            Optional[Book] найденная книга по ID или None если не найдена
+            Optional[Book] копия найденной книги по ID или None если не найдена
         """
-        for book in self.books:
-            if book.id == book_id:
-                return book
-        return None
+        self._refresh_if_stale()
+        return self._store.get(book_id)
 
     def search_books(
         self,
@@ -66,7 +131,9 @@ class JsonBookRepository(BaseBookRepository):
         Найти книги в JSON файле по заданному критерию поиска.
 
         Искомое слово содержится в заголовке книге,
-        либо искомое слово содержится в авторе книги либо год эквивалентен указанному
+        либо искомое слово содержится в авторе книги либо год эквивалентен указанному.
+        Заданные критерии объединяются через И. Кандидаты берутся из индексов n-грамм и года,
+        а затем проверяются тем же сравнением подстроки без учета регистра.
 
         Args:
             title: Optional[str] Заголовок
@@ -74,15 +141,36 @@ class JsonBookRepository(BaseBookRepository):
             year: Optional[int] Год издания
 
         Returns:
-            list[Book]: список книг подпадающих под поисковый критерий
+            list[Book]: копии книг подпадающих под поисковый критерий, упорядоченные по ID
         """
-        result: list[Book] = deepcopy(self.books)
-        if title:
-            result = [book for book in result if title.lower() in book.title.lower()]
-        if author:
-            result = [book for book in result if author.lower() in book.author.lower()]
+        self._refresh_if_stale()
+        candidate_ids: Optional[set[int]] = None
         if year:
-            result = [book for book in result if book.year == year]
+            candidate_ids = self._year_index.get(year, set())
+        for index, query in ((self._title_index, title), (self._author_index, author)):
+            if not query:
+                continue
+            index_candidates: Optional[set[int]] = index.candidates(query)
+            if index_candidates is not None:
+                candidate_ids = index_candidates if candidate_ids is None else candidate_ids & index_candidates
+
+        rows: Iterable[int]
+        if candidate_ids is None:
+            rows = self._store.rows()
+        else:
+            rows = sorted(row for row in map(self._store.row_of, candidate_ids) if row is not None)
+
+        title_query: str = title.lower() if title else ''
+        author_query: str = author.lower() if author else ''
+        result: list[Book] = []
+        for row in rows:
+            if year and self._store.year_at(row) != year:
+                continue
+            if title_query and title_query not in self._store.title_at(row).lower():
+                continue
+            if author_query and author_query not in self._store.author_at(row).lower():
+                continue
+            result.append(self._store.book_at(row))
         return result
 
     def list_books(self) -> List[Book]:
@@ -90,9 +178,35 @@ class JsonBookRepository(BaseBookRepository):
         Загрузить все имеющиеся в JSON файле книги.
 
         Returns:
-            list[Book]: список книг или пустой список
+            list[Book]: список копий книг или пустой список
+        """
+        self._refresh_if_stale()
+        return list(self._store.books())
+
+    def list_books_page(self, limit: int, after_id: int = 0, offset: int = 0) -> List[Book]:
+        """
+        Получить страницу книг, упорядоченных по ID, без копирования всего каталога.
+
+        Args:
+            limit: int максимальное количество книг на странице
+            after_id: int вернуть только книги с ID больше указанного
+            offset: int пропустить указанное количество книг после курсора
+
+        Returns:
+            list[Book]: копии книг страницы
+        """
+        self._refresh_if_stale()
+        return self._store.page(limit=limit, after_id=after_id, offset=offset)
+
+    def count_books(self) -> int:
+        """
+        Посчитать количество книг в хранилище.
+
+        Returns:
+            int: количество книг
         """
-        return self.books
+        self._refresh_if_stale()
+        return len(self._store)
 
     def update_book(self, book: Book) -> None:
         """
@@ -101,21 +215,227 @@ class JsonBookRepository(BaseBookRepository):
         Args:
             book: Book сущность Book
         """
-        for index, existing_book in enumerate(self.books):
-            if existing_book.id == book.id:
-                self.books[index] = book
-                break
-        self._write_books(self.books)
+        with self._write_transaction():
+            if book.id not in self._store:
+                return
+            self._store_book(book)
+            if self.journaled:
+                self._append_to_journal({'op': BookJournal.OP_UPDATE, 'book': self._to_record(book)})
+            else:
+                self._write_books(self._store.books())
 
-    def _write_books(self, books: List[Book]) -> None:
+    def reserve_ids(self, count: int = 1) -> range:
+        """
+        Зарезервировать блок новых уникальных ID.
+
+        Args:
+            count: int количество ID
+
+        Returns:
+            range: зарезервированные ID
+        """
+        with self._lock.exclusive():
+            self._id_sequence.reload()
+            return self._id_sequence.reserve(count)
+
+    def compact(self) -> None:
+        """Синхронно свернуть журнал изменений в новый снимок JSON файла."""
+        self._wait_for_compaction()
+        with self._lock.exclusive():
+            self._refresh_if_stale()
+            self._compact_locked()
+
+    def close(self) -> None:
+        """Дождаться завершения фонового сворачивания журнала и закрыть файл блокировки."""
+        self._wait_for_compaction()
+        self._lock.close()
+
+    def _load(self) -> None:
+        """Загрузить каталог с диска: снимок, журналы, индексы и последовательность ID; вызывается под блокировкой."""
+        self._ensure_file_exists()
+        # Книги хранятся в колонках, упорядоченных по ID; сущности Book создаются только при выдаче наружу
+        self._store: ColumnarBookStore = ColumnarBookStore(self._read_books())
+        self._title_index: NgramIndex = NgramIndex()
+        self._author_index: NgramIndex = NgramIndex()
+        self._year_index: dict[int, set[int]] = {}
+        self._recover_from_journal()
+        for book in self._store.books():
+            self._index_book(book)
+        self._id_sequence: IdSequence = IdSequence(self.file_path + self.SEQUENCE_SUFFIX)
+        self._id_sequence.observe(self._store.max_id())
+        self._version = self._lock.version()
+
+    def _refresh_if_stale(self) -> None:
+        """Перечитать каталог, если другой процесс зафиксировал изменение после последней загрузки."""
+        if self._lock.version() == self._version:
+            return
+        with self._lock.exclusive():
+            if self._lock.version() != self._version:
+                self._load()
+
+    @contextmanager
+    def _write_transaction(self) -> Iterator[None]:
+        """
+        Выполнить изменение под исключительной блокировкой каталога и увеличить его версию.
+
+        Если изменение прервано ошибкой, состояние в памяти считается устаревшим и перечитывается
+        при следующем обращении.
+
+        Yields:
+            None
+        """
+        with self._lock.exclusive():
+            self._refresh_if_stale()
+            self._id_sequence.reload()
+            try:
+                yield
+            except BaseException:
+                self._version = None
+                raise
+            self._version = self._lock.bump_version()
+
+    def _store_book(self, book: Book) -> None:
+        """
+        Записать поля книги в колоночное хранилище и обновить индексы.
+
+        Хранилище копирует значения полей, а не сам объект, поэтому изменение объекта вызывающей
+        стороной без update_book не меняет состояние хранилища и не рассинхронизирует индексы.
+
+        Args:
+            book: Book сущность Book
+        """
+        previous: Optional[Book] = self._store.put(book)
+        if previous is not None:
+            self._unindex_book(previous)
+        self._index_book(book)
+
+    def _index_book(self, book: Book) -> None:
+        """
+        Добавить книгу в индексы поиска.
+
+        Args:
+            book: Book сущность Book
+        """
+        self._title_index.add(book.id, book.title)
+        self._author_index.add(book.id, book.author)
+        self._year_index.setdefault(book.year, set()).add(book.id)
+
+    def _unindex_book(self, book: Book) -> None:
+        """
+        Удалить книгу из индексов поиска.
+
+        Args:
+            book: Book сущность Book в том виде, в котором она была проиндексирована
+        """
+        self._title_index.remove(book.id, book.title)
+        self._author_index.remove(book.id, book.author)
+        year_ids: Optional[set[int]] = self._year_index.get(book.year)
+        if year_ids is not None:
+            year_ids.discard(book.id)
+            if not year_ids:
+                del self._year_index[book.year]
+
+    @staticmethod
+    def _to_record(book: Book) -> dict:
+        """
+        Преобразовать книгу в словарь для записи в JSON файл.
+
+        Args:
+            book: Book сущность Book
+
+        Returns:
+            dict: поля книги в формате JSON файла
+        """
+        return {'id': book.id, 'title': book.title, 'author': book.author, 'year': book.year, '_status': book.status}
+
+    def _write_books(self, books: Iterable[Book]) -> None:
         """
         Сохранить все книги в JSON файл.
 
         Args:
-            books: list[Book] список сущностей Book
+            books: Iterable[Book] коллекция сущностей Book
         """
         with open(self.file_path, 'w') as file1:
-            json.dump([book.__dict__ for book in books], file1, indent=self._DEFAULT_INDENT)
+            json.dump([self._to_record(book) for book in books], file1, indent=self._DEFAULT_INDENT)
+
+    def _write_snapshot(self, rows: List[dict]) -> None:
+        """
+        Атомарно заменить JSON файл новым снимком: запись во временный файл, fsync и переименование.
+
+        Args:
+            rows: list[dict] книги в виде словарей
+        """
+        atomic_write_json(self.file_path, rows, indent=self._DEFAULT_INDENT)
+
+    def _append_to_journal(self, record: dict) -> None:
+        """
+        Дописать изменение в журнал и при необходимости запустить сворачивание.
+
+        Args:
+            record: dict запись об изменении
+        """
+        self._journal.append(record)
+        self._compact_if_needed()
+
+    def _compact_if_needed(self) -> None:
+        """Запустить фоновое сворачивание журнала, если он превысил порог."""
+        if self._journal.size() < self.compaction_threshold:
+            return
+        if self._compaction_thread is not None and self._compaction_thread.is_alive():
+            return
+        if self._compacting_journal.exists():
+            # Предыдущее сворачивание не завершилось: журнал продолжает расти до compact() или перезапуска
+            return
+        self._journal.rotate(self._compacting_journal.file_path)
+        self._compaction_thread = Thread(target=self._compact, name='book-journal-compaction')
+        self._compaction_thread.start()
+
+    def _compact(self) -> None:
+        """
+        Записать снимок и удалить свернутый в него журнал.
+
+        Снимок включает и записи текущего журнала; повторное применение журнала идемпотентно.
+        Если каталог успел изменить другой процесс, сворачивание откладывается до следующей загрузки.
+        """
+        with self._lock.exclusive():
+            if self._lock.version() != self._version or not self._compacting_journal.exists():
+                return
+            self._write_snapshot([self._to_record(book) for book in self._store.books()])
+            self._compacting_journal.remove()
+
+    def _compact_locked(self) -> None:
+        """Записать снимок текущего состояния и удалить оба журнала; вызывается под блокировкой."""
+        self._write_snapshot([self._to_record(book) for book in self._store.books()])
+        self._compacting_journal.remove()
+        self._journal.remove()
+
+    def _wait_for_compaction(self) -> None:
+        """Дождаться окончания фонового сворачивания журнала."""
+        if self._compaction_thread is not None:
+            self._compaction_thread.join()
+            self._compaction_thread = None
+
+    def _recover_from_journal(self) -> None:
+        """
+        Применить журналы поверх снимка.
+
+        Записи применяются идемпотентно (добавление и обновление заменяют книгу по ID), поэтому
+        журнал, не удаленный после прерванного сворачивания, можно безопасно применить повторно.
+        Незавершенное сворачивание, а также журнал в режиме без журнала сворачиваются сразу.
+        """
+        pending_compaction: bool = self._compacting_journal.exists()
+        if not pending_compaction and not self._journal.exists():
+            return
+
+        for journal in (self._compacting_journal, self._journal):
+            for record in journal.read_records():
+                if record['op'] == BookJournal.OP_DELETE:
+                    self._store.delete(record['id'])
+                else:
+                    self._store.put(Book(**record['book']))
+
+        if pending_compaction or not self.journaled or self._journal.size() >= self.compaction_threshold:
+            self._compact_locked()
 
     def _ensure_file_exists(self) -> None:
         """Проверить существует ли файл по заданному пути, если нет - то создать пустой JSON файл."""
@@ -0,0 +1,104 @@
+import os
+
+from src.domain.repository import BaseBookRepository
+from src.infra.repository.binary_book_repository import BinaryBookRepository
+from src.infra.repository.id_sequence import IdSequence
+from src.infra.repository.json_book_repository import JsonBookRepository
+from src.infra.repository.sqlite_book_repository import SqliteBookRepository
+
+
+def migrate_json_to_sqlite(json_path: str, sqlite_path: str) -> int:
+    """
+    Однократно перенести каталог из JSON файла в базу SQLite.
+
+    Журнал JSON хранилища применяется при открытии, поэтому переносится актуальное состояние.
+    Верхняя граница ID переносится вместе с книгами, чтобы ID удаленных книг не выдавались повторно.
+
+    Args:
+        json_path: str путь к JSON файлу с книгами
+        sqlite_path: str путь к создаваемой базе SQLite
+
+    Returns:
+        int: количество перенесенных книг
+    """
+    source: BaseBookRepository = JsonBookRepository(json_path)
+    target: SqliteBookRepository = SqliteBookRepository(sqlite_path)
+    try:
+        # Резерв одного ID в исходном хранилище безопасен: после переноса оно больше не используется
+        last_id: int = source.reserve_ids(1)[0] - 1
+        imported: int = target.import_books(source.list_books(), last_id=last_id)
+    finally:
+        target.close()
+    return imported
+
+
+def migrate_json_to_binary(json_path: str, binary_path: str) -> int:
+    """
+    Перенести каталог из JSON файла в бинарный каталог вместе с верхней границей ID.
+
+    Args:
+        json_path: str путь к JSON файлу с книгами
+        binary_path: str путь к создаваемому бинарному каталогу
+
+    Returns:
+        int: количество перенесенных книг
+
+    Raises:
+        FileExistsError: если бинарный каталог уже существует
+    """
+    if os.path.exists(binary_path):
+        raise FileExistsError(binary_path)
+    source: BaseBookRepository = JsonBookRepository(json_path)
+    target: BinaryBookRepository = BinaryBookRepository(binary_path)
+    try:
+        # Резерв одного ID в исходном хранилище безопасен: после переноса оно больше не используется
+        last_id: int = source.reserve_ids(1)[0] - 1
+        books: list = source.list_books()
+        target.add_books(books)
+        max_book_id: int = books[-1].id if books else 0
+        if last_id > max_book_id:
+            target.reserve_ids(last_id - max_book_id)
+    finally:
+        target.close()
+    return len(books)
+
+
+def export_binary_to_json(binary_path: str, json_path: str) -> int:
+    """
+    Выгрузить бинарный каталог в JSON файл вместе с верхней границей ID.
+
+    Args:
+        binary_path: str путь к бинарному каталогу
+        json_path: str путь к создаваемому JSON файлу
+
+    Returns:
+        int: количество выгруженных книг
+
+    Raises:
+        FileExistsError: если JSON файл уже существует
+    """
+    if os.path.exists(json_path):
+        raise FileExistsError(json_path)
+    source: BinaryBookRepository = BinaryBookRepository(binary_path)
+    try:
+        last_id: int = source.last_id
+        books: list = source.list_books()
+    finally:
+        source.close()
+    IdSequence(json_path + JsonBookRepository.SEQUENCE_SUFFIX).observe(last_id)
+    JsonBookRepository(json_path).add_books(books)
+    return len(books)
+
+
+def should_migrate_json(json_path: str, target_path: str) -> bool:
+    """
+    Проверить, нужно ли переносить каталог: целевое хранилище еще не создано, а JSON файл существует.
+
+    Args:
+        json_path: str путь к JSON файлу с книгами
+        target_path: str путь к файлу целевого хранилища
+
+    Returns:
+        bool: True если перенос нужен
+    """
+    return os.path.exists(json_path) and not os.path.exists(target_path)
@@ -0,0 +1,85 @@
+from typing import Dict, Optional, Set
+
+
+class NgramIndex:
+    """
+    Инвертированный индекс n-грамм для поиска подстроки без учета регистра.
+
+    Индекс строится по тексту в нижнем регистре (как и сравнение `query.lower() in text.lower()`)
+    и возвращает множество кандидатов: каждая книга, содержащая подстроку, в нем есть,
+    но не каждый кандидат ее содержит, поэтому результат нужно проверить исходным предикатом.
+    """
+
+    DEFAULT_GRAM_SIZE: int = 3
+
+    def __init__(self, gram_size: int = DEFAULT_GRAM_SIZE):
+        """
+        Создать пустой индекс.
+
+        Args:
+            gram_size: int длина n-граммы
+        """
+        self.gram_size: int = gram_size
+        self._postings: Dict[str, Set[int]] = {}
+
+    def add(self, book_id: int, text: str) -> None:
+        """
+        Проиндексировать текст книги.
+
+        Args:
+            book_id: int ID книги
+            text: str индексируемый текст, например заголовок
+        """
+        for gram in self._grams(text.lower()):
+            self._postings.setdefault(gram, set()).add(book_id)
+
+    def remove(self, book_id: int, text: str) -> None:
+        """
+        Удалить книгу из индекса.
+
+        Args:
+            book_id: int ID книги
+            text: str текст, с которым книга была проиндексирована
+        """
+        for gram in self._grams(text.lower()):
+            posting: Optional[Set[int]] = self._postings.get(gram)
+            if posting is None:
+                continue
+            posting.discard(book_id)
+            if not posting:
+                del self._postings[gram]
+
+    def candidates(self, query: str) -> Optional[Set[int]]:
+        """
+        Найти кандидатов, которые могут содержать подстроку.
+
+        Args:
+            query: str искомая подстрока
+
+        Returns:
+            Optional[Set[int]]: ID кандидатов или None, если запрос короче n-граммы и индекс неприменим
+        """
+        grams: Set[str] = self._grams(query.lower())
+        if not grams:
+            return None
+        postings: list[Set[int]] = []
+        for gram in grams:
+            posting: Optional[Set[int]] = self._postings.get(gram)
+            if not posting:
+                return set()
+            postings.append(posting)
+        postings.sort(key=len)
+        return postings[0].intersection(*postings[1:])
+
+    def _grams(self, text: str) -> Set[str]:
+        """
+        Разбить текст на уникальные n-граммы.
+
+        Args:
+            text: str текст в нижнем регистре
+
+        Returns:
+            Set[str]: множество n-грамм, пустое если текст короче n-граммы
+        """
+        size: int = self.gram_size
+        return {text[start:start + size] for start in range(len(text) - size + 1)}
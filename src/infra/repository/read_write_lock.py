@@ -0,0 +1,60 @@
+from contextlib import contextmanager
+from threading import Condition, Lock
+from typing import Iterator
+
+
+class ReadWriteLock:
+    """
+    Блокировка читателей и писателей между потоками.
+
+    Читатели работают параллельно, писатель получает исключительный доступ. Ожидающий писатель
+    не пропускает вперед новых читателей, поэтому постоянный поток чтений не откладывает запись навсегда.
+    """
+
+    def __init__(self):
+        """Создать свободную блокировку."""
+        self._condition: Condition = Condition(Lock())
+        self._readers: int = 0
+        self._writer_active: bool = False
+        self._writers_waiting: int = 0
+
+    @contextmanager
+    def read(self) -> Iterator[None]:
+        """
+        Захватить блокировку на чтение.
+
+        Yields:
+            None
+        """
+        with self._condition:
+            while self._writer_active or self._writers_waiting:
+                self._condition.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._readers -= 1
+                if not self._readers:
+                    self._condition.notify_all()
+
+    @contextmanager
+    def write(self) -> Iterator[None]:
+        """
+        Захватить блокировку на запись.
+
+        Yields:
+            None
+        """
+        with self._condition:
+            self._writers_waiting += 1
+            while self._writer_active or self._readers:
+                self._condition.wait()
+            self._writers_waiting -= 1
+            self._writer_active = True
+        try:
+            yield
+        finally:
+            with self._condition:
+                self._writer_active = False
+                self._condition.notify_all()
@@ -0,0 +1,319 @@
+import sqlite3
+from typing import Iterable, List, Optional
+
+from src.domain.entity import Book
+from src.domain.repository import BaseBookRepository
+
+
+def _contains_ci(text: str, query: str) -> bool:
+    """
+    Проверить вхождение подстроки без учета регистра так же, как это делает JsonBookRepository.
+
+    Args:
+        text: str текст поля книги
+        query: str искомая подстрока
+
+    Returns:
+        bool: True если подстрока содержится в тексте
+    """
+    return query.lower() in text.lower()
+
+
+class SqliteBookRepository(BaseBookRepository):
+    """
+    Хранилище книг в базе SQLite.
+
+    Книги не загружаются в память целиком: запросы идут по индексам (первичный ключ, год, статус),
+    а поиск подстроки в заголовке и авторе использует таблицу FTS5 с токенизатором trigram.
+    Кандидаты из FTS5 дополнительно проверяются тем же сравнением без учета регистра,
+    что и в JsonBookRepository, поэтому семантика поиска у хранилищ одинаковая.
+    """
+
+    _FTS_MIN_QUERY_LENGTH: int = 3
+    _SCHEMA: str = """
+        CREATE TABLE IF NOT EXISTS books (
+            id INTEGER PRIMARY KEY,
+            title TEXT NOT NULL,
+            author TEXT NOT NULL,
+            year INTEGER NOT NULL,
+            status TEXT NOT NULL DEFAULT 'available'
+        );
+        CREATE INDEX IF NOT EXISTS books_year_idx ON books (year);
+        CREATE INDEX IF NOT EXISTS books_status_idx ON books (status);
+        CREATE TABLE IF NOT EXISTS id_sequence (last_id INTEGER NOT NULL);
+        INSERT INTO id_sequence (last_id)
+            SELECT COALESCE((SELECT MAX(id) FROM books), 0) WHERE NOT EXISTS (SELECT 1 FROM id_sequence);
+    """
+    _FTS_SCHEMA: str = """
+        CREATE VIRTUAL TABLE IF NOT EXISTS books_fts USING fts5 (
+            title, author, content='books', content_rowid='id', tokenize='trigram'
+        );
+        CREATE TRIGGER IF NOT EXISTS books_fts_insert AFTER INSERT ON books BEGIN
+            INSERT INTO books_fts (rowid, title, author) VALUES (new.id, new.title, new.author);
+        END;
+        CREATE TRIGGER IF NOT EXISTS books_fts_delete AFTER DELETE ON books BEGIN
+            INSERT INTO books_fts (books_fts, rowid, title, author) VALUES ('delete', old.id, old.title, old.author);
+        END;
+        CREATE TRIGGER IF NOT EXISTS books_fts_update AFTER UPDATE ON books
+        WHEN old.title IS NOT new.title OR old.author IS NOT new.author BEGIN
+            INSERT INTO books_fts (books_fts, rowid, title, author) VALUES ('delete', old.id, old.title, old.author);
+            INSERT INTO books_fts (rowid, title, author) VALUES (new.id, new.title, new.author);
+        END;
+    """
+    _SELECT_COLUMNS: str = 'SELECT id, title, author, year, status FROM books'
+    _UPSERT_BOOK: str = """
+        INSERT INTO books (id, title, author, year, status) VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT (id) DO UPDATE SET
+            title = excluded.title, author = excluded.author, year = excluded.year, status = excluded.status
+    """
+    _UPDATE_BOOK: str = 'UPDATE books SET title = ?, author = ?, year = ?, status = ? WHERE id = ?'
+    _DELETE_BOOK: str = 'DELETE FROM books WHERE id = ?'
+    _OBSERVE_ID: str = 'UPDATE id_sequence SET last_id = MAX(last_id, ?)'
+    _OBSERVE_MAX_BOOK_ID: str = (
+        'UPDATE id_sequence SET last_id = MAX(last_id, COALESCE((SELECT MAX(id) FROM books), 0))'
+    )
+    _ADVANCE_SEQUENCE: str = 'UPDATE id_sequence SET last_id = last_id + ?'
+    _SELECT_LAST_ID: str = 'SELECT last_id FROM id_sequence'
+
+    def __init__(self, file_path: str):
+        """
+        Открыть (или создать) базу SQLite с книгами.
+
+        Args:
+            file_path: str путь к файлу базы SQLite
+        """
+        self.file_path: str = file_path
+        # Соединение можно использовать из нескольких потоков, доступ упорядочивает ThreadSafeBookRepository
+        self._connection: sqlite3.Connection = sqlite3.connect(file_path, check_same_thread=False)
+        self._connection.execute('PRAGMA journal_mode = WAL')
+        self._connection.execute('PRAGMA synchronous = NORMAL')
+        self._connection.create_function('contains_ci', 2, _contains_ci, deterministic=True)
+        with self._connection:
+            self._connection.executescript(self._SCHEMA)
+        self._fts_enabled: bool = self._create_fts_schema()
+
+    def add_book(self, book: Book) -> None:
+        """
+        Добавить книгу в базу.
+
+        Args:
+            book: Book сущность Book для сохранения
+        """
+        with self._connection:
+            self._connection.execute(self._UPSERT_BOOK, self._to_row(book))
+            self._connection.execute(self._OBSERVE_ID, (book.id,))
+
+    def add_books(self, books: Iterable[Book]) -> None:
+        """
+        Добавить пакет книг в базу одной транзакцией.
+
+        Args:
+            books: Iterable[Book] сущности Book для сохранения
+        """
+        self.import_books(books)
+
+    def delete_book_by_id(self, book_id: int) -> None:
+        """
+        Удалить книгу из базы по ID.
+
+        Args:
+            book_id: int ID книги для удаления
+        """
+        with self._connection:
+            self._connection.execute(self._DELETE_BOOK, (book_id,))
+
+    def get_book_by_id(self, book_id: int) -> Optional[Book]:
+        """
+        Получить книгу из базы по ID.
+
+        Args:
+            book_id: int ID книги
+
+        Returns:
+            Optional[Book] найденная книга по ID или None если не найдена
+        """
+        row: Optional[tuple] = self._connection.execute(
+            f'{self._SELECT_COLUMNS} WHERE id = ?', (book_id,),
+        ).fetchone()
+        return None if row is None else self._to_book(row)
+
+    def search_books(
+        self,
+        title: Optional[str] = None,
+        author: Optional[str] = None,
+        year: Optional[int] = None,
+    ) -> List[Book]:
+        """
+        Найти книги по заголовку, автору и году издания, критерии объединяются через И.
+
+        Args:
+            title: Optional[str] подстрока заголовка
+            author: Optional[str] подстрока автора
+            year: Optional[int] год издания
+
+        Returns:
+            list[Book]: список книг подпадающих под поисковый критерий, упорядоченный по ID
+        """
+        conditions: list[str] = []
+        params: list = []
+        for column, query in (('title', title), ('author', author)):
+            if not query:
+                continue
+            if self._fts_enabled and len(query) >= self._FTS_MIN_QUERY_LENGTH:
+                conditions.append('id IN (SELECT rowid FROM books_fts WHERE books_fts MATCH ?)')
+                params.append(self._fts_phrase(column, query))
+            conditions.append(f'contains_ci({column}, ?)')
+            params.append(query)
+        if year:
+            conditions.append('year = ?')
+            params.append(year)
+
+        where: str = f" WHERE {' AND '.join(conditions)}" if conditions else ''
+        rows: list[tuple] = self._connection.execute(f'{self._SELECT_COLUMNS}{where} ORDER BY id', params).fetchall()
+        return [self._to_book(row) for row in rows]
+
+    def list_books(self) -> List[Book]:
+        """
+        Загрузить все книги из базы.
+
+        Returns:
+            list[Book]: список книг, упорядоченный по ID, или пустой список
+        """
+        rows: list[tuple] = self._connection.execute(f'{self._SELECT_COLUMNS} ORDER BY id').fetchall()
+        return [self._to_book(row) for row in rows]
+
+    def list_books_page(self, limit: int, after_id: int = 0, offset: int = 0) -> List[Book]:
+        """
+        Получить страницу книг по первичному ключу.
+
+        Args:
+            limit: int максимальное количество книг на странице
+            after_id: int вернуть только книги с ID больше указанного
+            offset: int пропустить указанное количество книг после курсора
+
+        Returns:
+            list[Book]: книги страницы, упорядоченные по ID
+        """
+        rows: list[tuple] = self._connection.execute(
+            f'{self._SELECT_COLUMNS} WHERE id > ? ORDER BY id LIMIT ? OFFSET ?', (after_id, limit, offset),
+        ).fetchall()
+        return [self._to_book(row) for row in rows]
+
+    def count_books(self) -> int:
+        """
+        Посчитать количество книг в базе.
+
+        Returns:
+            int: количество книг
+        """
+        return self._connection.execute('SELECT COUNT(*) FROM books').fetchone()[0]
+
+    def update_book(self, book: Book) -> None:
+        """
+        Обновить книгу в базе.
+
+        Args:
+            book: Book сущность Book
+        """
+        with self._connection:
+            self._connection.execute(self._UPDATE_BOOK, (book.title, book.author, book.year, book.status, book.id))
+
+    def reserve_ids(self, count: int = 1) -> range:
+        """
+        Зарезервировать блок новых уникальных ID.
+
+        Args:
+            count: int количество ID
+
+        Returns:
+            range: зарезервированные ID
+
+        Raises:
+            ValueError: если count меньше единицы
+        """
+        if count < 1:
+            raise ValueError(f'Количество резервируемых ID должно быть положительным. Дано: {count}')
+        with self._connection:
+            self._connection.execute(self._ADVANCE_SEQUENCE, (count,))
+            last_id: int = self._connection.execute(self._SELECT_LAST_ID).fetchone()[0]
+        return range(last_id - count + 1, last_id + 1)
+
+    def import_books(self, books: Iterable[Book], last_id: int = 0) -> int:
+        """
+        Загрузить книги в базу одной транзакцией, например при переносе каталога из JSON файла.
+
+        Args:
+            books: Iterable[Book] книги для загрузки
+            last_id: int верхняя граница уже выданных ID в исходном хранилище
+
+        Returns:
+            int: количество загруженных книг
+        """
+        imported: int = 0
+        with self._connection:
+            for book in books:
+                self._connection.execute(self._UPSERT_BOOK, self._to_row(book))
+                imported += 1
+            self._connection.execute(self._OBSERVE_ID, (last_id,))
+            self._connection.execute(self._OBSERVE_MAX_BOOK_ID)
+        return imported
+
+    def close(self) -> None:
+        """Закрыть соединение с базой."""
+        self._connection.close()
+
+    def _create_fts_schema(self) -> bool:
+        """
+        Создать таблицу FTS5 и триггеры синхронизации, если сборка SQLite их поддерживает.
+
+        Returns:
+            bool: True если полнотекстовый индекс доступен
+        """
+        try:
+            with self._connection:
+                self._connection.executescript(self._FTS_SCHEMA)
+        except sqlite3.OperationalError:
+            return False
+        return True
+
+    @staticmethod
+    def _fts_phrase(column: str, query: str) -> str:
+        """
+        Построить запрос FTS5, ищущий подстроку как фразу в одной колонке.
+
+        Args:
+            column: str колонка таблицы FTS5
+            query: str искомая подстрока
+
+        Returns:
+            str: выражение для оператора MATCH
+        """
+        escaped: str = query.replace('"', '""')
+        return f'{column} : "{escaped}"'
+
+    @staticmethod
+    def _to_row(book: Book) -> tuple:
+        """
+        Преобразовать книгу в строку таблицы books.
+
+        Args:
+            book: Book сущность Book
+
+        Returns:
+            tuple: значения колонок id, title, author, year, status
+        """
+        return book.id, book.title, book.author, book.year, book.status
+
+    @staticmethod
+    def _to_book(row: tuple) -> Book:
+        """
+        Преобразовать строку таблицы books в книгу.
+
+        Args:
+            row: tuple значения колонок id, title, author, year, status
+
+        Returns:
+            Book: сущность Book
+        """
+        book_id, title, author, year, status = row
+        return Book(id=book_id, title=title, author=author, year=year, _status=status)
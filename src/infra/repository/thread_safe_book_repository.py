@@ -0,0 +1,152 @@
+from typing import Iterable, List, Optional
+
+from src.domain.entity import Book
+from src.domain.repository import BaseBookRepository
+from src.infra.repository.read_write_lock import ReadWriteLock
+
+
+class ThreadSafeBookRepository(BaseBookRepository):
+    """
+    Потокобезопасная обертка над любым хранилищем книг.
+
+    Чтения выполняются параллельно под блокировкой на чтение, изменения и резервирование ID -
+    последовательно под блокировкой на запись, поэтому хранилище можно разделять между потоками,
+    например между рабочими потоками AsyncBookService.
+    """
+
+    def __init__(self, repository: BaseBookRepository):
+        """
+        Обернуть хранилище.
+
+        Args:
+            repository: BaseBookRepository хранилище, к которому нужно разделяемый доступ
+        """
+        self.repository: BaseBookRepository = repository
+        self._lock: ReadWriteLock = ReadWriteLock()
+
+    def add_book(self, book: Book) -> None:
+        """
+        Добавить книгу под блокировкой на запись.
+
+        Args:
+            book: Book сущность Book для сохранения
+        """
+        with self._lock.write():
+            self.repository.add_book(book)
+
+    def add_books(self, books: Iterable[Book]) -> None:
+        """
+        Добавить пакет книг под блокировкой на запись.
+
+        Args:
+            books: Iterable[Book] сущности Book для сохранения
+        """
+        books = list(books)
+        with self._lock.write():
+            self.repository.add_books(books)
+
+    def delete_book_by_id(self, book_id: int) -> None:
+        """
+        Удалить книгу под блокировкой на запись.
+
+        Args:
+            book_id: int ID книги для удаления
+        """
+        with self._lock.write():
+            self.repository.delete_book_by_id(book_id)
+
+    def get_book_by_id(self, book_id: int) -> Optional[Book]:
+        """
+        Получить книгу по ID под блокировкой на чтение.
+
+        Args:
+            book_id: int ID книги
+
+        Returns:
+            Optional[Book] найденная книга по ID или None если не найдена
+        """
+        with self._lock.read():
+            return self.repository.get_book_by_id(book_id)
+
+    def search_books(
+        self,
+        title: Optional[str] = None,
+        author: Optional[str] = None,
+        year: Optional[int] = None,
+    ) -> List[Book]:
+        """
+        Найти книги под блокировкой на чтение.
+
+        Args:
+            title: Optional[str] подстрока заголовка
+            author: Optional[str] подстрока автора
+            year: Optional[int] год издания
+
+        Returns:
+            list[Book]: список книг подпадающих под поисковый критерий
+        """
+        with self._lock.read():
+            return self.repository.search_books(title=title, author=author, year=year)
+
+    def list_books(self) -> List[Book]:
+        """
+        Загрузить все книги под блокировкой на чтение.
+
+        Returns:
+            list[Book]: список книг или пустой список
+        """
+        with self._lock.read():
+            return self.repository.list_books()
+
+    def list_books_page(self, limit: int, after_id: int = 0, offset: int = 0) -> List[Book]:
+        """
+        Получить страницу книг под блокировкой на чтение.
+
+        Args:
+            limit: int максимальное количество книг на странице
+            after_id: int вернуть только книги с ID больше указанного
+            offset: int пропустить указанное количество книг после курсора
+
+        Returns:
+            list[Book]: книги страницы
+        """
+        with self._lock.read():
+            return self.repository.list_books_page(limit=limit, after_id=after_id, offset=offset)
+
+    def count_books(self) -> int:
+        """
+        Посчитать книги под блокировкой на чтение.
+
+        Returns:
+            int: количество книг
+        """
+        with self._lock.read():
+            return self.repository.count_books()
+
+    def update_book(self, book: Book) -> None:
+        """
+        Обновить книгу под блокировкой на запись.
+
+        Args:
+            book: Book сущность Book
+        """
+        with self._lock.write():
+            self.repository.update_book(book)
+
+    def reserve_ids(self, count: int = 1) -> range:
+        """
+        Зарезервировать блок ID под блокировкой на запись.
+
+        Args:
+            count: int количество ID
+
+        Returns:
+            range: зарезервированные ID
+        """
+        with self._lock.write():
+            return self.repository.reserve_ids(count)
+
+    def close(self) -> None:
+        """Закрыть обернутое хранилище после завершения всех операций."""
+        with self._lock.write():
+            self.repository.close()
@@ -0,0 +1,69 @@
+import os
+import unittest
+from tempfile import TemporaryDirectory
+
+from src.application.service import BookService
+from src.infra.adapter import BookImporter
+from src.infra.adapter.book_importer import ImportReport
+from src.infra.repository import JsonBookRepository
+
+
+class TestBookImporter(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Создаем временный каталог для хранилища и импортируемых файлов"""
+        self.temp_dir = TemporaryDirectory()
+        self.repository = JsonBookRepository(os.path.join(self.temp_dir.name, 'books.json'))
+        self.service = BookService(self.repository)
+        self.importer = BookImporter(self.service, chunk_size=2)
+
+    def tearDown(self) -> None:
+        """Удаляем временный каталог"""
+        self.temp_dir.cleanup()
+
+    def _write_file(self, name: str, content: str) -> str:
+        """Записать импортируемый файл во временный каталог"""
+        file_path: str = os.path.join(self.temp_dir.name, name)
+        with open(file_path, 'w', encoding='utf-8') as file1:
+            file1.write(content)
+        return file_path
+
+    def test_import_csv_reports_rejected_rows(self) -> None:
+        """
+        Позитивный тест-кейс: Импорт CSV добавляет корректные строки и отклоняет некорректные
+        Дано: CSV с тремя корректными строками и строкой с нечисловым годом
+        Ожидаемый результат: Добавлены три книги, отклонена одна строка с номером строки файла
+        """
+        file_path: str = self._write_file('books.csv', (
+            'title,author,year\n'
+            'Заголовок 1,Автор 1,2001\n'
+            'Заголовок 2,Автор 2,две тысячи\n'
+            'Заголовок 3,Автор 3,2003\n'
+            'Заголовок 4,Автор 4,2004\n'
+        ))
+        report: ImportReport = self.importer.import_file(file_path)
+        self.assertEqual(report.imported, 3)
+        self.assertEqual([rejected.line_number for rejected in report.rejected], [3])
+        self.assertIn('две тысячи', report.rejected[0].reason)
+        self.assertEqual([book.id for book in self.service.list_books()], [1, 2, 3])
+
+    def test_import_jsonl_reports_malformed_and_incomplete_lines(self) -> None:
+        """
+        Позитивный тест-кейс: Импорт JSONL отклоняет битые строки и строки без обязательных полей
+        Дано: JSONL с корректной строкой, битым JSON и строкой без автора
+        Ожидаемый результат: Добавлена одна книга, отклонены две строки
+        """
+        file_path: str = self._write_file('books.jsonl', (
+            '{"title": "Заголовок", "author": "Автор", "year": 2020}\n'
+            '{"title": "Битая строка"\n'
+            '\n'
+            '{"title": "Без автора", "year": 2021}\n'
+        ))
+        report: ImportReport = self.importer.import_file(file_path)
+        self.assertEqual(report.imported, 1)
+        self.assertEqual([rejected.line_number for rejected in report.rejected], [2, 4])
+        self.assertEqual(self.service.search_books(title="Заголовок")[0].year, 2020)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,23 +1,28 @@
 import json
+import multiprocessing
+import os
+import tracemalloc
 import unittest
-from tempfile import NamedTemporaryFile
+from dataclasses import asdict, dataclass
+from tempfile import NamedTemporaryFile, TemporaryDirectory
 from src.domain.entity import Book
 from src.domain.repository import BaseBookRepository
-from src.infra.repository import JsonBookRepository
+from src.infra.repository import BinaryBookRepository, JsonBookRepository, SqliteBookRepository
+from src.infra.repository.catalog_lock import fcntl
+from src.infra.repository.columnar_book_store import ColumnarBookStore
+from src.infra.repository.migration import (
+    export_binary_to_json, migrate_json_to_binary, migrate_json_to_sqlite, should_migrate_json,
+)
 
 
-class TestJsonBookRepository(unittest.TestCase):
+class BookRepositoryContract:
+    """Тест-кейсы контракта BaseBookRepository, общие для всех реализаций хранилища"""
 
-    def setUp(self) -> None:
-        """Создаем временный файл для хранилища книг"""
-        self.temp_file = NamedTemporaryFile(delete=False, mode='w')
-        self.temp_file.write(json.dumps([]))
-        self.temp_file.close()
-        self.repository: BaseBookRepository = JsonBookRepository(self.temp_file.name)
+    repository: BaseBookRepository
 
-    def tearDown(self) -> None:
-        """Закрываем и удаляем временный файл"""
-        self.temp_file.close()
+    def _open_repository(self) -> BaseBookRepository:
+        """Открыть хранилище поверх тех же файлов, что и self.repository"""
+        raise NotImplementedError
 
     def test_add_and_list_books(self) -> None:
         """
@@ -31,6 +36,20 @@ class TestJsonBookRepository(unittest.TestCase):
         self.assertEqual(len(books), 1)
         self.assertEqual(books[0].title, "Заголовок")
 
+    def test_add_books_batch(self) -> None:
+        """
+        Позитивный тест-кейс: Пакет книг добавляется в репозиторий и сохраняется
+        Дано: Пакет из двух валидных книг
+        Ожидаемый результат: После повторного открытия в хранилище обе книги
+        """
+        self.repository.add_books([
+            Book(id=1, title="Заголовок 1", author="Автор", year=2023),
+            Book(id=2, title="Заголовок 2", author="Автор", year=2022),
+        ])
+        reopened: BaseBookRepository = self._open_repository()
+        self.assertEqual([book.id for book in reopened.list_books()], [1, 2])
+        self.assertEqual(reopened.reserve_ids(), range(3, 4))
+
     def test_delete_book(self) -> None:
         """
         Позитивный тест-кейс: Удаление книги из репозитория по ID
@@ -80,6 +99,416 @@ class TestJsonBookRepository(unittest.TestCase):
         updated_book: Book = self.repository.get_book_by_id(1)
         self.assertEqual(updated_book.title, "Новый заголовок")
 
+    def test_delete_keeps_order_and_lookup_of_other_books(self) -> None:
+        """
+        Позитивный тест-кейс: Удаление книги из середины не нарушает порядок и поиск остальных книг по ID
+        Дано: Три валидные книги, удаляем среднюю
+        Ожидаемый результат: Остаются первая и третья книги в порядке добавления, обе находятся по ID
+        """
+        for book_id in (1, 2, 3):
+            self.repository.add_book(Book(id=book_id, title=f"Заголовок {book_id}", author="Автор", year=2023))
+        self.repository.delete_book_by_id(2)
+        self.assertEqual([book.id for book in self.repository.list_books()], [1, 3])
+        self.assertIsNone(self.repository.get_book_by_id(2))
+        self.assertEqual(self.repository.get_book_by_id(3).title, "Заголовок 3")
+
+    def test_list_books_page_and_iter_books(self) -> None:
+        """
+        Позитивный тест-кейс: Постраничное чтение по курсору и по смещению
+        Дано: Пять книг, одна из них удалена
+        Ожидаемый результат: Страницы упорядочены по ID, перебор возвращает все оставшиеся книги
+        """
+        for book_id in range(1, 6):
+            self.repository.add_book(Book(id=book_id, title=f"Заголовок {book_id}", author="Автор", year=2023))
+        self.repository.delete_book_by_id(3)
+        self.assertEqual([book.id for book in self.repository.list_books_page(limit=2)], [1, 2])
+        self.assertEqual([book.id for book in self.repository.list_books_page(limit=2, after_id=2)], [4, 5])
+        self.assertEqual([book.id for book in self.repository.list_books_page(limit=2, offset=3)], [5])
+        self.assertEqual([book.id for book in self.repository.iter_books(page_size=2, after_id=1)], [2, 4, 5])
+        self.assertEqual(self.repository.count_books(), 4)
+
+    def test_returned_books_are_isolated_from_storage(self) -> None:
+        """
+        Позитивный тест-кейс: Изменение книг, полученных из репозитория, не меняет хранилище
+        Дано: Валидная книга; меняем заголовок у результатов поиска, списка и поиска по ID
+        Ожидаемый результат: В хранилище и в поиске остается исходный заголовок
+        """
+        self.repository.add_book(Book(id=1, title="Заголовок", author="Автор", year=2023))
+        self.repository.search_books(title="Заголовок")[0].title = "Изменено"
+        self.repository.list_books()[0].title = "Изменено"
+        self.repository.get_book_by_id(1).title = "Изменено"
+        self.assertEqual(self.repository.get_book_by_id(1).title, "Заголовок")
+        self.assertEqual(len(self.repository.search_books(title="Заголовок")), 1)
+
+    def test_reserve_ids_survives_restart(self) -> None:
+        """
+        Позитивный тест-кейс: Зарезервированные ID не выдаются повторно после перезапуска
+        Дано: Резервируем блок из трех ID и открываем хранилище заново
+        Ожидаемый результат: Следующий ID идет после зарезервированного блока
+        """
+        self.assertEqual(self.repository.reserve_ids(3), range(1, 4))
+        reopened: BaseBookRepository = self._open_repository()
+        self.assertEqual(reopened.reserve_ids(), range(4, 5))
+
+    def test_search_matches_substring_semantics(self) -> None:
+        """
+        Позитивный тест-кейс: Поиск по индексам совпадает с поиском подстроки без учета регистра
+        Дано: Книги с разными заголовками, авторами и годами; одна книга обновлена, одна удалена
+        Ожидаемый результат: Для каждого запроса результат совпадает с полным перебором
+        """
+        titles = ["Война и мир", "Мир без войны", "Анна Каренина", "War and Peace", "Peaceful WARriors"]
+        authors = ["Лев Толстой", "Неизвестный", "Толстой Л.Н.", "Leo Tolstoy", "Dan Millman"]
+        for book_id, (title, author) in enumerate(zip(titles, authors), start=1):
+            self.repository.add_book(Book(id=book_id, title=title, author=author, year=1860 + book_id % 2))
+        self.repository.update_book(Book(id=2, title="Мир и покой", author="Неизвестный", year=1861))
+        self.repository.delete_book_by_id(3)
+
+        queries = [
+            {"title": "мир"}, {"title": "ВОЙН"}, {"title": "и"}, {"title": "war"}, {"title": "покой"},
+            {"title": "каренина"}, {"author": "толст"}, {"author": "tol", "year": 1861},
+            {"title": "peace", "author": "leo"}, {"year": 1860}, {"title": "нет такого"}, {},
+        ]
+        all_books: list[Book] = self.repository.list_books()
+        for query in queries:
+            expected = [
+                book.id for book in all_books
+                if query.get("title", "").lower() in book.title.lower()
+                and query.get("author", "").lower() in book.author.lower()
+                and query.get("year", book.year) == book.year
+            ]
+            found = [book.id for book in self.repository.search_books(**query)]
+            self.assertEqual(found, expected, query)
+
+
+class TestJsonBookRepository(BookRepositoryContract, unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Создаем временный файл для хранилища книг"""
+        self.temp_file = NamedTemporaryFile(delete=False, mode='w')
+        self.temp_file.write(json.dumps([]))
+        self.temp_file.close()
+        self.repository: BaseBookRepository = self._open_repository()
+
+    def tearDown(self) -> None:
+        """Закрываем и удаляем временный файл"""
+        self.temp_file.close()
+
+    def _open_repository(self) -> BaseBookRepository:
+        """Открыть JSON хранилище во временном файле"""
+        return JsonBookRepository(self.temp_file.name)
+
+
+class TestSqliteBookRepository(BookRepositoryContract, unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Создаем временный каталог для базы SQLite"""
+        self.temp_dir = TemporaryDirectory()
+        self.file_path: str = os.path.join(self.temp_dir.name, 'books.sqlite3')
+        self.repository: BaseBookRepository = self._open_repository()
+
+    def tearDown(self) -> None:
+        """Закрываем базу и удаляем временный каталог"""
+        self.repository.close()
+        self.temp_dir.cleanup()
+
+    def _open_repository(self) -> BaseBookRepository:
+        """Открыть базу SQLite во временном каталоге"""
+        return SqliteBookRepository(self.file_path)
+
+    def test_migrate_from_json(self) -> None:
+        """
+        Позитивный тест-кейс: Каталог переносится из JSON файла в SQLite вместе с верхней границей ID
+        Дано: JSON хранилище с двумя книгами, вторая удалена
+        Ожидаемый результат: В базе одна книга, новый ID не повторяет ID удаленной книги
+        """
+        json_path: str = os.path.join(self.temp_dir.name, 'books.json')
+        source = JsonBookRepository(json_path)
+        source.add_book(Book(id=1, title="Заголовок 1", author="Автор", year=2023))
+        source.add_book(Book(id=2, title="Заголовок 2", author="Автор", year=2022))
+        source.delete_book_by_id(2)
+        migrated_path: str = os.path.join(self.temp_dir.name, 'migrated.sqlite3')
+
+        self.assertTrue(should_migrate_json(json_path, migrated_path))
+        self.assertEqual(migrate_json_to_sqlite(json_path, migrated_path), 1)
+        migrated = SqliteBookRepository(migrated_path)
+        self.assertEqual([book.title for book in migrated.list_books()], ["Заголовок 1"])
+        self.assertEqual(migrated.reserve_ids(), range(3, 4))
+        migrated.close()
+        self.assertFalse(should_migrate_json(json_path, migrated_path))
+
+
+def _add_books_from_process(file_path: str, count: int) -> None:
+    """Добавить книги в общий JSON каталог из отдельного процесса"""
+    repository = JsonBookRepository(file_path, journaled=True)
+    for _ in range(count):
+        book_id: int = repository.reserve_ids()[0]
+        repository.add_book(Book(id=book_id, title=f"Книга {book_id}", author="Автор", year=2000))
+    repository.close()
+
+
+class TestBinaryBookRepository(BookRepositoryContract, unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Создаем временный каталог для бинарного каталога"""
+        self.temp_dir = TemporaryDirectory()
+        self.file_path: str = os.path.join(self.temp_dir.name, 'books.bin')
+        self.repository: BaseBookRepository = self._open_repository()
+
+    def tearDown(self) -> None:
+        """Закрываем каталог и удаляем временный каталог"""
+        self.repository.close()
+        self.temp_dir.cleanup()
+
+    def _open_repository(self) -> BaseBookRepository:
+        """Открыть бинарный каталог во временном каталоге"""
+        return BinaryBookRepository(self.file_path)
+
+    def test_out_of_order_ids_and_revive(self) -> None:
+        """
+        Позитивный тест-кейс: ID, добавленные не по возрастанию, и повторно добавленная удаленная книга
+        Дано: книги с ID 5, 2, 7; книга 2 удалена и добавлена снова с новым заголовком
+        Ожидаемый результат: книги находятся по ID, списки упорядочены по ID, после переоткрытия данные те же
+        """
+        for book_id in (5, 2, 7):
+            self.repository.add_book(Book(id=book_id, title=f"Книга {book_id}", author="Автор", year=2000))
+        self.repository.delete_book_by_id(2)
+        self.assertIsNone(self.repository.get_book_by_id(2))
+        self.repository.add_book(Book(id=2, title="Книга два", author="Автор", year=2001))
+        self.repository.close()
+        self.repository = self._open_repository()
+
+        self.assertEqual(self.repository.get_book_by_id(2).title, "Книга два")
+        self.assertEqual([book.id for book in self.repository.list_books()], [2, 5, 7])
+        self.assertEqual([book.id for book in self.repository.list_books_page(limit=1, after_id=2)], [5])
+        self.assertEqual(self.repository.count_books(), 3)
+
+    def test_convert_json_to_binary_and_back(self) -> None:
+        """
+        Позитивный тест-кейс: Каталог переносится из JSON в бинарный формат и обратно вместе с верхней границей ID
+        Дано: JSON хранилище с двумя книгами, вторая удалена
+        Ожидаемый результат: Обе копии содержат одну книгу, новый ID не повторяет ID удаленной книги
+        """
+        json_path: str = os.path.join(self.temp_dir.name, 'books.json')
+        source = JsonBookRepository(json_path)
+        source.add_book(Book(id=1, title="Заголовок 1", author="Автор", year=2023))
+        source.add_book(Book(id=2, title="Заголовок 2", author="Автор", year=2022))
+        source.delete_book_by_id(2)
+        binary_path: str = os.path.join(self.temp_dir.name, 'migrated.bin')
+        exported_path: str = os.path.join(self.temp_dir.name, 'exported.json')
+
+        self.assertTrue(should_migrate_json(json_path, binary_path))
+        self.assertEqual(migrate_json_to_binary(json_path, binary_path), 1)
+        self.assertEqual(export_binary_to_json(binary_path, exported_path), 1)
+        migrated = BinaryBookRepository(binary_path)
+        self.assertEqual([book.title for book in migrated.list_books()], ["Заголовок 1"])
+        self.assertEqual(migrated.reserve_ids(), range(3, 4))
+        migrated.close()
+        exported = JsonBookRepository(exported_path)
+        self.assertEqual([book.title for book in exported.list_books()], ["Заголовок 1"])
+        self.assertEqual(exported.reserve_ids(), range(3, 4))
+
+
+class TestColumnarBookStore(unittest.TestCase):
+
+    def test_put_replace_delete_and_revive(self) -> None:
+        """
+        Позитивный тест-кейс: Колоночное хранилище добавляет, заменяет, удаляет и восстанавливает книги
+        Дано: Книги, добавленные не по порядку ID
+        Ожидаемый результат: Книги выдаются по возрастанию ID с актуальными полями
+        """
+        store = ColumnarBookStore([Book(id=3, title="Третья", author="Автор", year=2003)])
+        store.put(Book(id=1, title="Первая", author="Автор", year=2001))
+        previous = store.put(Book(id=3, title="Третья, исправленная", author="Другой", year=2004, _status="borrowed"))
+        self.assertEqual(previous.title, "Третья")
+        self.assertEqual(store.delete(1).title, "Первая")
+        self.assertIsNone(store.get(1))
+        store.put(Book(id=1, title="Снова первая", author="Автор", year=2001))
+        self.assertEqual(
+            [(book.id, book.title, book.author, book.year, book.status) for book in store.books()],
+            [(1, "Снова первая", "Автор", 2001, "available"), (3, "Третья, исправленная", "Другой", 2004, "borrowed")],
+        )
+
+    def test_compaction_keeps_live_books(self) -> None:
+        """
+        Позитивный тест-кейс: Сжатие после массового удаления сохраняет оставшиеся книги
+        Дано: Две тысячи книг, удалена каждая вторая
+        Ожидаемый результат: Остаются книги с нечетными ID, страницы считаются от оставшихся книг
+        """
+        store = ColumnarBookStore(Book(id=book_id, title=f"Книга {book_id}", author="Автор", year=2000)
+                                  for book_id in range(1, 2001))
+        for book_id in range(2, 2001, 2):
+            store.delete(book_id)
+        self.assertEqual(len(store), 1000)
+        self.assertEqual([book.id for book in store.page(limit=3, offset=1)], [3, 5, 7])
+        self.assertEqual(store.get(1999).title, "Книга 1999")
+
+    def test_memory_per_book_is_at_least_five_times_smaller(self) -> None:
+        """
+        Позитивный тест-кейс: Колоночное хранилище занимает как минимум в 5 раз меньше памяти
+        Дано: Десять тысяч книг в словаре обычных датаклассов и в колоночном хранилище
+        Ожидаемый результат: Прирост памяти колоночного хранилища меньше в 5 и более раз
+        """
+        @dataclass
+        class PlainBook:
+            id: int
+            title: str
+            author: str
+            year: int
+            _status: str = "available"
+
+        rows: list[dict] = [
+            {"id": book_id, "title": f"Заголовок книги номер {book_id}", "author": f"Автор {book_id % 100}",
+             "year": 1900 + book_id % 120, "_status": "available"}
+            for book_id in range(1, 10001)
+        ]
+        serialized: str = json.dumps(rows)
+        tracemalloc.start()
+        try:
+            before: int = tracemalloc.get_traced_memory()[0]
+            plain_books: dict = {row["id"]: PlainBook(**row) for row in json.loads(serialized)}
+            plain_bytes: int = tracemalloc.get_traced_memory()[0] - before
+            del plain_books
+            before = tracemalloc.get_traced_memory()[0]
+            store = ColumnarBookStore(Book(**row) for row in json.loads(serialized))
+            store_bytes: int = tracemalloc.get_traced_memory()[0] - before
+        finally:
+            tracemalloc.stop()
+        self.assertEqual(len(store), 10000)
+        self.assertGreaterEqual(plain_bytes / store_bytes, 5)
+
+
+class TestJournaledJsonBookRepository(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Создаем временный каталог для снимка и журнала"""
+        self.temp_dir = TemporaryDirectory()
+        self.file_path: str = os.path.join(self.temp_dir.name, 'books.json')
+        self.repository = JsonBookRepository(self.file_path, journaled=True)
+
+    def tearDown(self) -> None:
+        """Дожидаемся фонового сворачивания и удаляем временный каталог"""
+        self.repository.close()
+        self.temp_dir.cleanup()
+
+    def test_mutation_is_appended_to_journal(self) -> None:
+        """
+        Позитивный тест-кейс: Добавление книги дописывает журнал и не переписывает снимок
+        Дано: Пустое хранилище в режиме журнала
+        Ожидаемый результат: Снимок остался пустым, в журнале одна запись
+        """
+        self.repository.add_book(Book(id=1, title="Заголовок", author="Автор", year=2023))
+        with open(self.file_path) as file1:
+            self.assertEqual(json.load(file1), [])
+        with open(self.file_path + '.journal', encoding='utf-8') as file1:
+            self.assertEqual(len(file1.readlines()), 1)
+
+    def test_journal_is_replayed_on_open(self) -> None:
+        """
+        Позитивный тест-кейс: При открытии журнал применяется поверх снимка
+        Дано: Добавлены две книги, одна удалена, другая обновлена
+        Ожидаемый результат: Новый экземпляр репозитория видит итоговое состояние
+        """
+        self.repository.add_book(Book(id=1, title="Заголовок 1", author="Автор", year=2023))
+        self.repository.add_book(Book(id=2, title="Заголовок 2", author="Автор", year=2022))
+        self.repository.delete_book_by_id(1)
+        self.repository.update_book(Book(id=2, title="Новый заголовок", author="Автор", year=2022))
+
+        reopened = JsonBookRepository(self.file_path, journaled=True)
+        books: list[Book] = reopened.list_books()
+        self.assertEqual([book.id for book in books], [2])
+        self.assertEqual(books[0].title, "Новый заголовок")
+
+    def test_journal_is_compacted_after_threshold(self) -> None:
+        """
+        Позитивный тест-кейс: Журнал сворачивается в снимок после превышения порога
+        Дано: Порог сворачивания в один байт
+        Ожидаемый результат: Книга записана в снимок, файлов журнала не осталось
+        """
+        repository = JsonBookRepository(self.file_path, journaled=True, compaction_threshold=1)
+        repository.add_book(Book(id=1, title="Заголовок", author="Автор", year=2023))
+        repository.close()
+        with open(self.file_path) as file1:
+            self.assertEqual([row['id'] for row in json.load(file1)], [1])
+        self.assertFalse(os.path.exists(self.file_path + '.journal'))
+        self.assertFalse(os.path.exists(self.file_path + '.journal.compacting'))
+
+    def test_interrupted_compaction_is_recovered(self) -> None:
+        """
+        Позитивный тест-кейс: Журнал, оставшийся после прерванного сворачивания, применяется повторно
+        Дано: Снимок уже содержит книгу, но сворачиваемый журнал не был удален
+        Ожидаемый результат: Книга не дублируется, журнал свернут
+        """
+        self.repository.add_book(Book(id=1, title="Заголовок", author="Автор", year=2023))
+        self.repository.compact()
+        with open(self.file_path + '.journal.compacting', 'w', encoding='utf-8') as file1:
+            file1.write(json.dumps({'op': 'add', 'book': asdict(self.repository.get_book_by_id(1))}) + '\n')
+
+        reopened = JsonBookRepository(self.file_path, journaled=True)
+        self.assertEqual(len(reopened.list_books()), 1)
+        self.assertFalse(os.path.exists(self.file_path + '.journal.compacting'))
+
+
+class TestSharedJsonBookRepository(unittest.TestCase):
+
+    def setUp(self) -> None:
+        """Создаем временный каталог и два экземпляра хранилища над одним файлом"""
+        self.temp_dir = TemporaryDirectory()
+        self.file_path: str = os.path.join(self.temp_dir.name, 'books.json')
+        self.first = JsonBookRepository(self.file_path)
+        self.second = JsonBookRepository(self.file_path, journaled=True)
+
+    def tearDown(self) -> None:
+        """Закрываем хранилища и удаляем временный каталог"""
+        self.first.close()
+        self.second.close()
+        self.temp_dir.cleanup()
+
+    def test_changes_of_other_writer_are_visible(self) -> None:
+        """
+        Позитивный тест-кейс: Изменения одного экземпляра видны другому без перезапуска
+        Дано: Два экземпляра хранилища над одним файлом, первый добавляет книги, второй одну удаляет
+        Ожидаемый результат: Оба экземпляра видят одинаковый каталог и не затирают изменения друг друга
+        """
+        self.first.add_books([
+            Book(id=1, title="Заголовок 1", author="Автор", year=2023),
+            Book(id=2, title="Заголовок 2", author="Автор", year=2022),
+        ])
+        self.assertEqual(self.second.count_books(), 2)
+        self.second.delete_book_by_id(1)
+        self.first.add_book(Book(id=3, title="Заголовок 3", author="Автор", year=2021))
+
+        self.assertEqual([book.id for book in self.first.list_books()], [2, 3])
+        self.assertEqual([book.id for book in self.second.search_books(author="автор")], [2, 3])
+
+    def test_reserve_ids_is_shared(self) -> None:
+        """
+        Позитивный тест-кейс: Экземпляры резервируют ID из общей последовательности
+        Дано: Два экземпляра хранилища над одним файлом
+        Ожидаемый результат: Блоки ID не пересекаются
+        """
+        self.assertEqual(self.first.reserve_ids(2), range(1, 3))
+        self.assertEqual(self.second.reserve_ids(2), range(3, 5))
+        self.assertEqual(self.first.reserve_ids(), range(5, 6))
+
+    @unittest.skipIf(fcntl is None, "блокировка fcntl недоступна")
+    def test_concurrent_processes_do_not_lose_writes(self) -> None:
+        """
+        Позитивный тест-кейс: Несколько процессов одновременно добавляют книги в общий каталог
+        Дано: Четыре процесса, каждый добавляет по 25 книг
+        Ожидаемый результат: В каталоге 100 книг с уникальными ID
+        """
+        processes: list = [
+            multiprocessing.Process(target=_add_books_from_process, args=(self.file_path, 25)) for _ in range(4)
+        ]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+
+        books: list[Book] = self.first.list_books()
+        self.assertEqual(len(books), 100)
+        self.assertEqual(len({book.id for book in books}), 100)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -1,11 +1,14 @@
+import asyncio
 import json
+import os
 import unittest
-from tempfile import NamedTemporaryFile
+from tempfile import NamedTemporaryFile, TemporaryDirectory
 
-from src.application.service import BookService
+from src.application.service import AsyncBookService, BookService
 from src.domain.entity import Book
 from src.domain.repository import BaseBookRepository
-from src.infra.repository import JsonBookRepository
+from src.exception import PublishingYearMustBeNumericError
+from src.infra.repository import JsonBookRepository, SqliteBookRepository, ThreadSafeBookRepository
 
 
 class TestBookService(unittest.TestCase):
@@ -47,6 +50,40 @@ class TestBookService(unittest.TestCase):
         self.service.delete_book_by_id(book.id)
         self.assertIsNone(self.repository.get_book_by_id(book.id))
 
+    def test_deleted_book_id_is_not_reused(self) -> None:
+        """
+        Позитивный тест-кейс: ID удаленной книги не выдается новой книге
+        Дано: Добавляем две книги и удаляем последнюю
+        Ожидаемый результат: Новая книга получает следующий после удаленного ID
+        """
+        self.service.add_book("Заголовок 1", "Автор", 2022)
+        book: Book = self.service.add_book("Заголовок 2", "Автор", 2022)
+        self.service.delete_book_by_id(book.id)
+        new_book: Book = self.service.add_book("Заголовок 3", "Автор", 2022)
+        self.assertEqual(new_book.id, book.id + 1)
+
+    def test_add_books(self) -> None:
+        """
+        Позитивный тест-кейс: Пакет книг добавляется с подряд идущими ID
+        Дано: Пакет из трех валидных книг
+        Ожидаемый результат: В хранилище три книги с ID 1, 2, 3
+        """
+        books: list[Book] = self.service.add_books([
+            ("Заголовок 1", "Автор", 2001), ("Заголовок 2", "Автор", 2002), ("Заголовок 3", "Автор", 2003),
+        ])
+        self.assertEqual([book.id for book in books], [1, 2, 3])
+        self.assertEqual(len(self.service.list_books()), 3)
+
+    def test_add_books_rejects_whole_batch_with_non_numeric_year(self) -> None:
+        """
+        Негативный тест-кейс: Пакет с нечисловым годом не сохраняется целиком
+        Дано: Пакет из валидной книги и книги с годом-строкой
+        Ожидаемый результат: Исключение PublishingYearMustBeNumericError, хранилище пустое
+        """
+        with self.assertRaises(PublishingYearMustBeNumericError):
+            self.service.add_books([("Заголовок 1", "Автор", 2001), ("Заголовок 2", "Автор", "год")])
+        self.assertEqual(self.service.list_books(), [])
+
     def test_search_books(self):
         """
         Позитивный тест-кейс: Книга добавленная в хранилище успешно находится по заголовку
@@ -82,5 +119,67 @@ class TestBookService(unittest.TestCase):
         self.assertEqual(updated_book.status, "borrowed")
 
 
+class TestAsyncBookService(unittest.IsolatedAsyncioTestCase):
+    _CLIENTS: int = 300
+
+    def setUp(self) -> None:
+        """Создаем временный каталог для хранилищ"""
+        self.temp_dir = TemporaryDirectory()
+
+    def tearDown(self) -> None:
+        """Удаляем временный каталог"""
+        self.temp_dir.cleanup()
+
+    def _open_service(self, repository: BaseBookRepository) -> AsyncBookService:
+        """Создать асинхронный сервис над потокобезопасной оберткой хранилища"""
+        return AsyncBookService(BookService(ThreadSafeBookRepository(repository)))
+
+    async def _check_concurrent_clients(self, service: AsyncBookService) -> None:
+        """Сотни клиентов одновременно добавляют, читают, ищут и меняют статус книг"""
+        added: list[Book] = await asyncio.gather(*(
+            service.add_book(f"Книга {number}", f"Автор {number % 10}", 2000 + number % 5)
+            for number in range(self._CLIENTS)
+        ))
+        self.assertEqual(len({book.id for book in added}), self._CLIENTS)
+
+        borrowed: list[Book] = added[::3]
+        results: list = await asyncio.gather(
+            *(service.set_book_status(book.id, "borrowed") for book in borrowed),
+            *(service.search_books(author="автор 7") for _ in range(self._CLIENTS)),
+            *(service.count_books() for _ in range(self._CLIENTS)),
+        )
+        searches: list = results[len(borrowed):len(borrowed) + self._CLIENTS]
+        self.assertTrue(all(len(found) == self._CLIENTS // 10 for found in searches))
+        self.assertTrue(all(count == self._CLIENTS for count in results[len(borrowed) + self._CLIENTS:]))
+
+        books: list[Book] = [book async for book in service.iter_books(page_size=64)]
+        self.assertEqual([book.id for book in books], sorted(book.id for book in added))
+        self.assertEqual(sum(book.status == "borrowed" for book in books), len(borrowed))
+
+    async def test_concurrent_clients_with_json_repository(self) -> None:
+        """
+        Позитивный тест-кейс: Сотни сопрограмм одновременно работают с JSON хранилищем
+        Дано: Асинхронный сервис над JSON хранилищем в режиме журнала
+        Ожидаемый результат: ID уникальны, чтения видят согласованный каталог, изменения не теряются
+        """
+        repository = JsonBookRepository(os.path.join(self.temp_dir.name, 'books.json'), journaled=True)
+        service: AsyncBookService = self._open_service(repository)
+        await self._check_concurrent_clients(service)
+        service.close()
+        repository.close()
+
+    async def test_concurrent_clients_with_sqlite_repository(self) -> None:
+        """
+        Позитивный тест-кейс: Сотни сопрограмм одновременно работают с базой SQLite
+        Дано: Асинхронный сервис над базой SQLite
+        Ожидаемый результат: ID уникальны, чтения видят согласованный каталог, изменения не теряются
+        """
+        repository = SqliteBookRepository(os.path.join(self.temp_dir.name, 'books.sqlite3'))
+        service: AsyncBookService = self._open_service(repository)
+        await self._check_concurrent_clients(service)
+        service.close()
+        repository.close()
+
+
 if __name__ == "__main__":
     unittest.main()